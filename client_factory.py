@@ -19,7 +19,7 @@ from .openai_client import OpenAIClient
 from .openai_speech_client import OpenAISpeechClient
 from .prompt_config import PromptConfig
 from .progress_bar import ProgressDialog
-from .settings import SettingsNames, get_settings
+from .settings import SettingsNames, get_settings, FALSE_FLAGS, TRUE_STRINGS
 from .speech_client import SpeechClient
 from .speech_config import SpeechConfig
 from .user_base_dialog import UserBaseDialog
@@ -426,7 +426,7 @@ class ClientFactory:
         if isinstance(value, bool):
             return value
         if isinstance(value, str):
-            return value.lower() in {"1", "true", "yes"}
+            return value.lower() in TRUE_STRINGS
         return bool(value)
 
     def _on_background_done(self, worker: NoteProcessor, on_success: Callable[[], None]) -> None:
@@ -501,7 +501,7 @@ class ClientFactory:
             return False
         if "::" in entry:
             _, flag = entry.rsplit("::", 1)
-            return flag.strip().lower() not in {"0", "false"}
+            return flag.strip().lower() not in FALSE_FLAGS
         return True
 
     @staticmethod
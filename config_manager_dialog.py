@@ -18,9 +18,9 @@ from PyQt6.QtWidgets import (
     QListWidget,
     QListWidgetItem,
     QMessageBox,
+    QPlainTextEdit,
     QPushButton,
     QScrollArea,
-    QTextEdit,
     QVBoxLayout,
     QWidget,
     QSpinBox,
@@ -42,7 +42,7 @@ from .provider_options import (
     TEXT_PROVIDERS,
     TEXT_PROVIDER_DEFAULTS,
 )
-from .settings import SettingsNames, get_settings
+from .settings import SettingsNames, get_settings, FALSE_FLAGS
 from .user_base_dialog import IMAGE_MAPPING_SEPARATOR
 
 
@@ -304,12 +304,10 @@ class ConfigManagerDialog(QDialog):
         text_prompt_form.setFieldGrowthPolicy(
             QFormLayout.FieldGrowthPolicy.ExpandingFieldsGrow
         )
-        self.system_prompt_input = QTextEdit()
-        self.system_prompt_input.setAcceptRichText(False)
+        self.system_prompt_input = QPlainTextEdit()
         self.system_prompt_input.setMinimumHeight(80)
         text_prompt_form.addRow(QLabel("System Prompt:"), self.system_prompt_input)
-        self.user_prompt_input = QTextEdit()
-        self.user_prompt_input.setAcceptRichText(False)
+        self.user_prompt_input = QPlainTextEdit()
         self.user_prompt_input.setMinimumHeight(120)
         text_prompt_form.addRow(QLabel("User Prompt:"), self.user_prompt_input)
         self.text_section.add_form_layout(text_prompt_form)
@@ -1418,7 +1416,7 @@ class ConfigManagerDialog(QDialog):
             enabled = True
             if "::" in mapping:
                 base, flag = mapping.rsplit("::", 1)
-                enabled = flag.strip().lower() not in {"0", "false", "no"}
+                enabled = flag.strip().lower() not in FALSE_FLAGS
             if IMAGE_MAPPING_SEPARATOR not in base:
                 continue
             left, right = [part.strip() for part in base.split(IMAGE_MAPPING_SEPARATOR, 1)]
@@ -8,6 +8,7 @@ from PyQt6.QtWidgets import (
     QHBoxLayout,
     QPushButton,
     QLineEdit,
+    QPlainTextEdit,
     QTextEdit,
 )
 
@@ -261,7 +262,7 @@ class CustomDialog(UserBaseDialog):
             return
         if isinstance(widget, QLineEdit):
             widget.setText(value or "")
-        elif isinstance(widget, QTextEdit):
+        elif isinstance(widget, (QPlainTextEdit, QTextEdit)):
             widget.setPlainText(value or "")
         elif isinstance(widget, QComboBox):
             widget.setCurrentText(value or "")
@@ -271,13 +272,9 @@ class CustomDialog(UserBaseDialog):
         response_keys, destination_fields = self.two_col_form.get_inputs()
         all_text_rows = self.two_col_form.get_all_rows()
         text_entries = [
-            {
-                "key": row.get("key", ""),
-                "field": row.get("field", ""),
-                "enabled": bool(row.get("enabled", True)),
-            }
-            for row in all_text_rows
-            if row.get("key") or row.get("field")
+            {"key": key, "field": field, "enabled": enabled}
+            for key, field, enabled in all_text_rows
+            if key or field
         ]
         image_pairs = []
         if hasattr(self, "image_mapping_form") and self.image_mapping_form:
@@ -15,7 +15,7 @@ from anki import hooks
 from .client_factory import ClientFactory
 from .config_manager_dialog import ConfigManagerDialog
 from .prompt_config import PromptConfig
-from .settings import SettingsNames, get_settings
+from .settings import SettingsNames, get_settings, TRUE_STRINGS
 from .scheduler import SchedulerManager
 
 
@@ -224,7 +224,7 @@ def _open_youglish_for_selection(browser) -> None:
         defaultValue=False,
     )
     if isinstance(overwrite, str):
-        overwrite = overwrite.lower() in {"1", "true", "yes", "on"}
+        overwrite = overwrite.lower() in TRUE_STRINGS
     overwrite = bool(overwrite)
     if not source_field:
         QMessageBox.information(
@@ -359,7 +359,7 @@ def _open_oaad_for_selection(browser) -> None:
         defaultValue=False,
     )
     if isinstance(overwrite, str):
-        overwrite = overwrite.lower() in {"1", "true", "yes", "on"}
+        overwrite = overwrite.lower() in TRUE_STRINGS
     overwrite = bool(overwrite)
     if not source_field:
         QMessageBox.information(
@@ -399,7 +399,7 @@ def _confirm_youglish_settings(browser) -> bool:
         defaultValue=True,
     )
     if isinstance(enabled, str):
-        enabled = enabled.strip().lower() in {"1", "true", "yes", "on"}
+        enabled = enabled.strip().lower() in TRUE_STRINGS
     if not enabled:
         QMessageBox.information(
             browser,
@@ -443,7 +443,7 @@ def _confirm_youglish_settings(browser) -> bool:
         defaultValue=False,
     )
     if isinstance(overwrite, str):
-        overwrite = overwrite.strip().lower() in {"1", "true", "yes", "on"}
+        overwrite = overwrite.strip().lower() in TRUE_STRINGS
     config_name = _current_config_name()
     summary = (
         f"配置: {config_name}\n"
@@ -469,7 +469,7 @@ def _confirm_oaad_settings(browser) -> bool:
         defaultValue=True,
     )
     if isinstance(enabled, str):
-        enabled = enabled.strip().lower() in {"1", "true", "yes", "on"}
+        enabled = enabled.strip().lower() in TRUE_STRINGS
     if not enabled:
         QMessageBox.information(
             browser,
@@ -506,7 +506,7 @@ def _confirm_oaad_settings(browser) -> bool:
         defaultValue=False,
     )
     if isinstance(overwrite, str):
-        overwrite = overwrite.lower() in {"1", "true", "yes", "on"}
+        overwrite = overwrite.lower() in TRUE_STRINGS
     overwrite = bool(overwrite)
     summary = (
         f"源字段: {source}\n"
@@ -546,7 +546,7 @@ def _maybe_auto_generate_on_add(note: AnkiNote) -> None:
         defaultValue=False,
     )
     if isinstance(enabled, str):
-        enabled = enabled.strip().lower() in {"1", "true", "yes", "on"}
+        enabled = enabled.strip().lower() in TRUE_STRINGS
     if not enabled:
         return
     note_id = getattr(note, "id", None)
@@ -670,7 +670,7 @@ def _as_bool(value, default: bool = False) -> bool:
     if isinstance(value, bool):
         return value
     if isinstance(value, str):
-        return value.strip().lower() in {"1", "true", "yes", "on"}
+        return value.strip().lower() in TRUE_STRINGS
     try:
         return bool(int(value))
     except Exception:
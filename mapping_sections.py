@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import Optional
 
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, pyqtSignal, pyqtSlot
 from PyQt6.QtGui import QFont
 from PyQt6.QtWidgets import (
     QCheckBox,
@@ -37,6 +37,7 @@ class ToggleMappingEditor(QWidget):
         self._right_placeholder = right_placeholder
         self._rows: list[dict[str, object]] = []
         self._global_enabled = True
+        self._has_enabled_complete = False
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -47,10 +48,10 @@ class ToggleMappingEditor(QWidget):
 
         controls = QHBoxLayout()
         select_all = QPushButton("Select All")
-        select_all.clicked.connect(lambda: self._set_all(True))
+        select_all.clicked.connect(self._on_select_all)
         controls.addWidget(select_all)
         select_none = QPushButton("Select None")
-        select_none.clicked.connect(lambda: self._set_all(False))
+        select_none.clicked.connect(self._on_select_none)
         controls.addWidget(select_none)
         invert = QPushButton("Invert")
         invert.clicked.connect(self._invert_all)
@@ -64,7 +65,7 @@ class ToggleMappingEditor(QWidget):
         layout.addLayout(self._rows_layout)
 
         self._add_button = QPushButton("Add Row")
-        self._add_button.clicked.connect(lambda: self.add_row())
+        self._add_button.clicked.connect(self._on_add_clicked)
         layout.addWidget(self._add_button)
 
         self.set_entries(entries or [])
@@ -131,6 +132,10 @@ class ToggleMappingEditor(QWidget):
         self._update_summary()
         self.rowsChanged.emit()
 
+    def has_enabled_complete_row(self) -> bool:
+        """Whether a checked row has both sides filled; the summary keeps it current."""
+        return self._has_enabled_complete
+
     def get_entries(self) -> list[tuple[str, str, bool]]:
         entries: list[tuple[str, str, bool]] = []
         for row in self._rows:
@@ -154,12 +159,25 @@ class ToggleMappingEditor(QWidget):
         self._add_button.setEnabled(enabled)
         self._update_summary()
 
+    @pyqtSlot()
+    def _on_select_all(self) -> None:
+        self._set_all(True)
+
+    @pyqtSlot()
+    def _on_select_none(self) -> None:
+        self._set_all(False)
+
+    @pyqtSlot()
+    def _on_add_clicked(self) -> None:
+        self.add_row()
+
     def _set_all(self, value: bool) -> None:
         for row in self._rows:
             checkbox: QCheckBox = row["checkbox"]  # type: ignore[assignment]
             checkbox.setChecked(value)
         self._update_summary()
 
+    @pyqtSlot()
     def _invert_all(self) -> None:
         for row in self._rows:
             checkbox: QCheckBox = row["checkbox"]  # type: ignore[assignment]
@@ -183,8 +201,10 @@ class ToggleMappingEditor(QWidget):
             if widget is not None:
                 widget.deleteLater()
         self._rows.clear()
+        self._has_enabled_complete = False
         self.rowsChanged.emit()
 
+    @pyqtSlot()
     def _on_row_changed(self) -> None:
         self._update_summary()
         self.rowsChanged.emit()
@@ -232,6 +252,7 @@ class ToggleMappingEditor(QWidget):
             if incomplete:
                 summary = f"{summary} (incomplete: {', '.join(incomplete)})"
 
+        self._has_enabled_complete = any(enabled for _, _, enabled in entries)
         self._summary_label.setText(summary)
         self.rowsChanged.emit()
 
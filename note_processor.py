@@ -28,7 +28,7 @@ from .exceptions import ErrorCode, ExternalException
 from .llm_client import LLMClient
 from .speech_client import SpeechClient
 from .prompt_config import PromptConfig
-from .settings import SettingsNames
+from .settings import SettingsNames, FALSE_FLAGS, TRUE_STRINGS
 from .gemini_client import GeminiClient
 
 IMAGE_MAPPING_SEPARATOR = "->"
@@ -1052,7 +1052,7 @@ class NoteProcessor(QThread):
         if isinstance(value, bool):
             return value
         if isinstance(value, str):
-            return value.strip().lower() in {"1", "true", "yes", "on"}
+            return value.strip().lower() in TRUE_STRINGS
         try:
             return bool(int(value))
         except Exception:
@@ -1162,7 +1162,7 @@ class NoteProcessor(QThread):
         enabled = True
         if "::" in entry:
             base, flag = entry.rsplit("::", 1)
-            enabled = flag.strip().lower() not in {"0", "false"}
+            enabled = flag.strip().lower() not in FALSE_FLAGS
         if IMAGE_MAPPING_SEPARATOR not in base:
             return "", "", False
         prompt, target = [
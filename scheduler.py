@@ -10,7 +10,7 @@ from aqt import gui_hooks, mw
 from aqt.qt import QTimer
 
 from .client_factory import ClientFactory
-from .settings import SettingsNames, get_settings
+from .settings import SettingsNames, get_settings, TRUE_STRINGS
 
 
 @dataclass
@@ -153,7 +153,7 @@ class SchedulerManager:
     def _load_config(self, settings) -> ScheduleConfig:
         enabled = settings.value(SettingsNames.SCHEDULE_ENABLED_SETTING_NAME, defaultValue=False)
         if isinstance(enabled, str):
-            enabled = enabled.strip().lower() in {"1", "true", "yes", "on"}
+            enabled = enabled.strip().lower() in TRUE_STRINGS
         query = settings.value(SettingsNames.SCHEDULE_QUERY_SETTING_NAME, defaultValue="", type=str) or ""
         interval = int(settings.value(SettingsNames.SCHEDULE_INTERVAL_MIN_SETTING_NAME, defaultValue=10) or 10)
         batch_size = int(settings.value(SettingsNames.SCHEDULE_BATCH_SIZE_SETTING_NAME, defaultValue=5) or 5)
@@ -9,6 +9,12 @@ except ImportError:  # pragma: no cover - fallback for tests outside Anki
 SETTINGS_ORGANIZATION = "github_rroessler1"
 SETTINGS_APPLICATION = "anki-gpt-plugin"
 
+# Stored strings that read as True, and mapping "::flag" suffixes that mark a
+# row disabled. Every module parses settings with these, so a stored value
+# means the same thing everywhere.
+TRUE_STRINGS = frozenset({"1", "true", "yes", "on"})
+FALSE_FLAGS = frozenset({"0", "false", "no"})
+
 
 class SettingsNames:
     API_KEY_SETTING_NAME = "api_key"
@@ -1,6 +1,9 @@
-from functools import partial
+from typing import Optional
 
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QStandardItem, QStandardItemModel
 from PyQt6.QtWidgets import (
+    QCompleter,
     QWidget,
     QVBoxLayout,
     QHBoxLayout,
@@ -11,68 +14,107 @@ from PyQt6.QtWidgets import (
     QLabel,
 )
 
+_CTRL_LABELS = ("Select All", "Select None", "Invert")
 
-class DynamicForm(QWidget):
-    """Editable two-column form for text response key → field mapping."""
 
-    def __init__(
-        self,
-        rows: list[tuple[str, str, bool]],
-        card_fields: list[str],
-    ) -> None:
+def _make_control_button(parent: QWidget, label: str, slot) -> QPushButton:
+    button = QPushButton(label, parent)
+    button.clicked.connect(slot)
+    return button
+
+
+def _with_blank_field(card_fields: list[str]) -> tuple[str, ...]:
+    """Return the combo choices with the blank entry first; empty input is fine."""
+    fields = tuple(card_fields)
+    if "" in fields:
+        return fields
+    return ("",) + fields
+
+
+def _build_field_model(fields: tuple[str, ...], parent: QWidget) -> QStandardItemModel:
+    """Build one field list model that every row combo box shares."""
+    model = QStandardItemModel(parent)
+    for field in fields:
+        model.appendRow(QStandardItem(field))
+    return model
+
+
+def _normalize_entry(entry: object) -> Optional[tuple[str, str, bool]]:
+    """Decode a stored row into (left, right, enabled); bare values fill the left."""
+    if isinstance(entry, (tuple, list)):
+        count = len(entry)  # type: ignore[arg-type]
+        if count >= 3:
+            return entry[0], entry[1], bool(entry[2])  # type: ignore[index]
+        if count == 2:
+            return entry[0], entry[1], True  # type: ignore[index]
+        return None
+    return str(entry), "", True
+
+
+def _text_of(widget: QWidget) -> str:
+    """Return the current text of a row's line edit or combo box."""
+    if isinstance(widget, QComboBox):
+        return widget.currentText()
+    return widget.text()  # type: ignore[attr-defined]
+
+
+class _MappingForm(QWidget):
+    """Rows of checkbox + two inputs with bulk controls and an enabled summary."""
+
+    def __init__(self, card_fields: list[str], add_label: str) -> None:
         super().__init__()
         self.layout = QVBoxLayout(self)
-        base_fields = list(card_fields)
-        if "" not in base_fields:
-            base_fields = [""] + base_fields
-        self._card_fields = base_fields
+        self._card_fields = _with_blank_field(card_fields)
+        self._card_field_set = frozenset(self._card_fields)
+        self._field_model = _build_field_model(self._card_fields, self)
         self._item_width = 250
         self._rows: list[dict[str, object]] = []
         self._master_override = False
         self._control_buttons: list[QPushButton] = []
+        self._stripped_cache: dict[int, tuple[str, str]] = {}
+        self._bulk_update = False
 
         self._summary_label = QLabel()
         self._summary_label.setWordWrap(True)
         self.layout.addWidget(self._summary_label)
 
-        control_layout = QHBoxLayout()
-        select_all = QPushButton("Select All")
-        select_all.clicked.connect(lambda: self._set_all(True))
-        select_none = QPushButton("Select None")
-        select_none.clicked.connect(lambda: self._set_all(False))
-        invert = QPushButton("Invert")
-        invert.clicked.connect(self._invert_all)
-        control_layout.addWidget(select_all)
-        control_layout.addWidget(select_none)
-        control_layout.addWidget(invert)
-        self._show_enabled_checkbox = QCheckBox("Show enabled only")
-        self._show_enabled_checkbox.stateChanged.connect(
-            lambda _: self._update_row_visibility()
-        )
-        control_layout.addWidget(self._show_enabled_checkbox)
-        control_layout.addStretch()
-        self._control_buttons = [select_all, select_none, invert]
-        self.layout.addLayout(control_layout)
+        self.layout.addLayout(self._create_controls())
 
-        self.add_button = QPushButton("Add Row")
-        self.add_button.clicked.connect(partial(self.add_row, key="", field="", enabled=True))
+        # Rows are appended to their own layout so the button stays below them.
+        self.rows_layout = QVBoxLayout()
+        self.layout.addLayout(self.rows_layout)
 
-        self._fill_initial_data(rows)
+        self.add_button = QPushButton(add_label)
+        self.add_button.clicked.connect(self._on_add_clicked)
         self.layout.addWidget(self.add_button)
         self.setLayout(self.layout)
-        self._update_summary()
 
-    def _fill_initial_data(self, rows: list[tuple[str, str, bool]]) -> None:
-        if rows:
-            for key, field, enabled in rows:
-                self.add_row(key, field, enabled)
-        else:
-            self.add_row()
+    def add_row(self, left: str = "", right: str = "", enabled: bool = True) -> None:
+        self._append_row(*self._make_inputs(left, right), enabled)
+
+    def _make_inputs(self, left: str, right: str) -> tuple[QWidget, QWidget]:
+        """Build the left and right input widgets of a new row."""
+        raise NotImplementedError
+
+    def _on_add_clicked(self, _checked: bool = False) -> None:
+        self.add_row()
 
-    def add_row(self, key: str = "", field: str = "", enabled: bool = True) -> None:
+    def _field_combo(self, value: str) -> QComboBox:
+        combo_box = QComboBox()
+        combo_box.setMaximumWidth(self._item_width)
+        combo_box.setModel(self._field_model)
+        if value in self._card_field_set:
+            combo_box.setCurrentText(value)
+        return combo_box
+
+    def _append_row(self, left: QWidget, right: QWidget, enabled: bool) -> None:
         row_widget = QWidget()
         row_layout = QHBoxLayout(row_widget)
         row_layout.setContentsMargins(0, 0, 0, 0)
+        cache_key = id(row_widget)
+
+        def invalidate(_: object) -> None:
+            self._stripped_cache.pop(cache_key, None)
 
         checkbox = QCheckBox()
         checkbox.setChecked(enabled)
@@ -80,54 +122,59 @@ class DynamicForm(QWidget):
         checkbox.stateChanged.connect(lambda _: self._on_row_updated())
         row_layout.addWidget(checkbox)
 
-        text_box = QLineEdit()
-        text_box.setText(key)
-        text_box.setMaximumWidth(self._item_width)
-        text_box.textChanged.connect(lambda _: self._on_row_updated())
-        row_layout.addWidget(text_box)
+        for widget in (left, right):
+            if isinstance(widget, QComboBox):
+                changed = widget.currentIndexChanged
+            else:
+                changed = widget.textChanged  # type: ignore[attr-defined]
+            changed.connect(invalidate)
+            changed.connect(lambda _: self._on_row_updated())
+            row_layout.addWidget(widget)
 
-        combo_box = QComboBox()
-        combo_box.setMaximumWidth(self._item_width)
-        combo_box.addItems(self._card_fields)
-        combo_box.setCurrentText(field)
-        combo_box.currentIndexChanged.connect(lambda _: self._on_row_updated())
-        row_layout.addWidget(combo_box)
-
-        index = self.layout.count() - 1
-        if index < 0:
-            self.layout.addWidget(row_widget)
-        else:
-            self.layout.insertWidget(index, row_widget)
+        self.rows_layout.addWidget(row_widget)
 
         self._rows.append(
             {
                 "widget": row_widget,
                 "checkbox": checkbox,
-                "key": text_box,
-                "field": combo_box,
+                "left": left,
+                "right": right,
             }
         )
-        self._update_summary()
-        self._update_row_visibility()
-
-    def clear_rows(self) -> None:
+        self._refresh_view()
+
+    def _fill_rows(self, rows: list[tuple[str, str, bool]]) -> None:
+        self.setUpdatesEnabled(False)
+        self._bulk_update = True
+        try:
+            if rows:
+                for entry in rows:
+                    normalized = _normalize_entry(entry)
+                    if normalized is not None:
+                        self.add_row(*normalized)
+            else:
+                self.add_row()
+        finally:
+            self._bulk_update = False
+            self.setUpdatesEnabled(True)
+        self._refresh_view()
+
+    def _discard_rows(self) -> None:
         for row in self._rows:
             widget = row["widget"]
-            self.layout.removeWidget(widget)
+            self.rows_layout.removeWidget(widget)
             widget.deleteLater()
         self._rows.clear()
-        self._update_summary()
-        self._update_row_visibility()
+        self._stripped_cache.clear()
+
+    def clear_rows(self) -> None:
+        self._discard_rows()
+        self._refresh_view()
 
     def set_rows(self, rows: list[tuple[str, str, bool]]) -> None:
-        self.clear_rows()
-        if rows:
-            for key, field, enabled in rows:
-                self.add_row(key, field, enabled)
-        else:
-            self.add_row()
-        self._update_summary()
-        self._update_row_visibility()
+        """Replace every row, refreshing the summary and visibility once."""
+        self._discard_rows()
+        self._fill_rows(rows)
 
     def set_master_override(self, master_checked: bool) -> None:
         self._master_override = master_checked
@@ -136,39 +183,49 @@ class DynamicForm(QWidget):
             checkbox.setEnabled(not master_checked)
         for button in self._control_buttons:
             button.setEnabled(not master_checked)
-        self._update_summary()
-        self._update_row_visibility()
+        self._refresh_view()
 
-    def get_inputs(self) -> tuple[list[str], list[str]]:
-        keys: list[str] = []
-        fields: list[str] = []
+    def get_all_rows(self) -> list[tuple[str, str, bool]]:
+        rows: list[tuple[str, str, bool]] = []
         for row in self._rows:
             checkbox: QCheckBox = row["checkbox"]  # type: ignore[assignment]
-            text_box: QLineEdit = row["key"]  # type: ignore[assignment]
-            combo_box: QComboBox = row["field"]  # type: ignore[assignment]
-            key = text_box.text().strip()
-            field = combo_box.currentText().strip()
-            if not key or not field:
-                continue
-            if self._master_override or checkbox.isChecked():
-                keys.append(key)
-                fields.append(field)
-        return keys, fields
+            left, right = self._stripped_values(row)
+            rows.append((left, right, checkbox.isChecked()))
+        return rows
 
-    def get_all_rows(self) -> list[dict[str, object]]:
-        rows: list[dict[str, object]] = []
-        for row in self._rows:
-            checkbox: QCheckBox = row["checkbox"]  # type: ignore[assignment]
-            text_box: QLineEdit = row["key"]  # type: ignore[assignment]
-            combo_box: QComboBox = row["field"]  # type: ignore[assignment]
-            rows.append(
-                {
-                    "key": text_box.text().strip(),
-                    "field": combo_box.currentText().strip(),
-                    "enabled": checkbox.isChecked(),
-                }
+    def _stripped_values(self, row: dict[str, object]) -> tuple[str, str]:
+        cache_key = id(row["widget"])
+        cached = self._stripped_cache.get(cache_key)
+        if cached is None:
+            cached = (
+                _text_of(row["left"]).strip(),  # type: ignore[arg-type]
+                _text_of(row["right"]).strip(),  # type: ignore[arg-type]
             )
-        return rows
+            self._stripped_cache[cache_key] = cached
+        return cached
+
+    def _create_controls(self) -> QHBoxLayout:
+        control_layout = QHBoxLayout()
+        slots = (self._select_all, self._select_none, self._invert_all)
+        self._control_buttons = [
+            _make_control_button(self, label, slot)
+            for label, slot in zip(_CTRL_LABELS, slots)
+        ]
+        for button in self._control_buttons:
+            control_layout.addWidget(button)
+        self._show_enabled_checkbox = QCheckBox("Show enabled only")
+        self._show_enabled_checkbox.stateChanged.connect(
+            lambda _: self._update_row_visibility()
+        )
+        control_layout.addWidget(self._show_enabled_checkbox)
+        control_layout.addStretch()
+        return control_layout
+
+    def _select_all(self) -> None:
+        self._set_all(True)
+
+    def _select_none(self) -> None:
+        self._set_all(False)
 
     def _set_all(self, value: bool) -> None:
         if self._master_override:
@@ -176,8 +233,7 @@ class DynamicForm(QWidget):
         for row in self._rows:
             checkbox: QCheckBox = row["checkbox"]  # type: ignore[assignment]
             checkbox.setChecked(value)
-        self._update_summary()
-        self._update_row_visibility()
+        self._refresh_view()
 
     def _invert_all(self) -> None:
         if self._master_override:
@@ -185,10 +241,14 @@ class DynamicForm(QWidget):
         for row in self._rows:
             checkbox: QCheckBox = row["checkbox"]  # type: ignore[assignment]
             checkbox.setChecked(not checkbox.isChecked())
-        self._update_summary()
-        self._update_row_visibility()
+        self._refresh_view()
 
     def _on_row_updated(self) -> None:
+        self._refresh_view()
+
+    def _refresh_view(self) -> None:
+        if self._bulk_update:
+            return
         self._update_summary()
         self._update_row_visibility()
 
@@ -196,25 +256,28 @@ class DynamicForm(QWidget):
         entries: list[tuple[str, str, bool]] = []
         for row in self._rows:
             checkbox: QCheckBox = row["checkbox"]  # type: ignore[assignment]
-            text_box: QLineEdit = row["key"]  # type: ignore[assignment]
-            combo_box: QComboBox = row["field"]  # type: ignore[assignment]
-            key = text_box.text().strip()
-            field = combo_box.currentText().strip()
-            if not key and not field:
+            left, right = self._stripped_values(row)
+            if not left and not right:
                 continue
-            enabled = bool(key and field) and (self._master_override or checkbox.isChecked())
-            entries.append((key, field, enabled))
+            enabled = bool(left and right) and (
+                self._master_override or checkbox.isChecked()
+            )
+            entries.append((left, right, enabled))
         if not entries:
             self._summary_label.setText('Enabled mappings: none configured')
             return
         total = len(entries)
-        enabled_entries = [f"{key} -> {field}" for key, field, enabled in entries if enabled]
+        enabled_entries = [
+            f"{left} -> {right}" for left, right, enabled in entries if enabled
+        ]
         enabled_count = len(enabled_entries)
         if enabled_entries:
             summary = f"Enabled ({enabled_count}/{total}): {', '.join(enabled_entries)}"
         else:
             summary = f"Enabled (0/{total}): none"
-        disabled_entries = [f"{key} -> {field}" for key, field, enabled in entries if not enabled]
+        disabled_entries = [
+            f"{left} -> {right}" for left, right, enabled in entries if not enabled
+        ]
         if disabled_entries:
             summary = f"{summary} (disabled: {', '.join(disabled_entries)})"
         self._summary_label.setText(summary)
@@ -230,270 +293,74 @@ class DynamicForm(QWidget):
             widget.setVisible(visible)
 
 
-class ImageMappingForm(QWidget):
-    """Mapping editor for image generation prompts."""
-
-    def __init__(self, rows: list[tuple[str, str, bool]], card_fields: list[str]):
-        super().__init__()
-        base_fields = list(card_fields)
-        if "" not in base_fields:
-            base_fields = [""] + base_fields
-        self._card_fields = base_fields
-        self._item_width = 250
-        self.layout = QVBoxLayout(self)
-        self._rows: list[dict[str, object]] = []
-        self._control_buttons: list[QPushButton] = []
-        self._master_override = False
-
-        self._summary_label = QLabel()
-        self._summary_label.setWordWrap(True)
-        self.layout.addWidget(self._summary_label)
-
-        control_layout = QHBoxLayout()
-        select_all = QPushButton("Select All")
-        select_all.clicked.connect(lambda: self._set_all(True))
-        select_none = QPushButton("Select None")
-        select_none.clicked.connect(lambda: self._set_all(False))
-        invert = QPushButton("Invert")
-        invert.clicked.connect(self._invert_all)
-        control_layout.addWidget(select_all)
-        control_layout.addWidget(select_none)
-        control_layout.addWidget(invert)
-        self._show_enabled_checkbox = QCheckBox("Show enabled only")
-        self._show_enabled_checkbox.stateChanged.connect(
-            lambda _: self._update_row_visibility()
-        )
-        control_layout.addWidget(self._show_enabled_checkbox)
-        control_layout.addStretch()
-        self._control_buttons = [select_all, select_none, invert]
-        self.layout.addLayout(control_layout)
-
-        self.add_button = QPushButton("Add Mapping")
-        self.add_button.clicked.connect(lambda: self.add_row())
-
-        if rows:
-            for prompt_field, image_field, enabled in rows:
-                self.add_row(prompt_field, image_field, enabled)
-        else:
-            self.add_row()
-
-        self.layout.addWidget(self.add_button)
-        self.setLayout(self.layout)
-        self._update_summary()
-        self._update_row_visibility()
+class DynamicForm(_MappingForm):
+    """Editable two-column form for text response key → field mapping."""
 
-    def add_row(
+    def __init__(
         self,
-        prompt_field: str = "",
-        image_field: str = "",
-        enabled: bool = True,
+        rows: list[tuple[str, str, bool]],
+        card_fields: list[str],
     ) -> None:
-        row_widget = QWidget()
-        row_layout = QHBoxLayout(row_widget)
-        row_layout.setContentsMargins(0, 0, 0, 0)
+        super().__init__(card_fields, "Add Row")
+        # Response keys usually mirror field names; one completer serves all rows.
+        self._key_completer = QCompleter(self._field_model, self)
+        self._key_completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        self._fill_rows(rows)
 
-        checkbox = QCheckBox()
-        checkbox.setChecked(enabled)
-        checkbox.setEnabled(not self._master_override)
-        checkbox.stateChanged.connect(lambda _: self._on_row_updated())
-        row_layout.addWidget(checkbox)
+    def _make_inputs(self, key: str, field: str) -> tuple[QWidget, QWidget]:
+        text_box = QLineEdit()
+        text_box.setText(key)
+        text_box.setMaximumWidth(self._item_width)
+        text_box.setCompleter(self._key_completer)
+        return text_box, self._field_combo(field)
 
-        prompt_combo = QComboBox()
-        prompt_combo.setMaximumWidth(self._item_width)
-        prompt_combo.addItems(self._card_fields)
-        prompt_combo.setCurrentText(prompt_field)
-        prompt_combo.currentIndexChanged.connect(lambda _: self._on_row_updated())
-        row_layout.addWidget(prompt_combo)
-
-        image_combo = QComboBox()
-        image_combo.setMaximumWidth(self._item_width)
-        image_combo.addItems(self._card_fields)
-        image_combo.setCurrentText(image_field)
-        image_combo.currentIndexChanged.connect(lambda _: self._on_row_updated())
-        row_layout.addWidget(image_combo)
-
-        index = self.layout.count() - 1
-        if index < 0:
-            self.layout.addWidget(row_widget)
-        else:
-            self.layout.insertWidget(index, row_widget)
+    def get_inputs(self) -> tuple[list[str], list[str]]:
+        keys: list[str] = []
+        fields: list[str] = []
+        master_override = self._master_override
+        for row in self._rows:
+            checkbox: QCheckBox = row["checkbox"]  # type: ignore[assignment]
+            if not (master_override or checkbox.isChecked()):
+                continue
+            key, field = self._stripped_values(row)
+            if key and field:
+                keys.append(key)
+                fields.append(field)
+        return keys, fields
 
-        self._rows.append(
-            {
-                "widget": row_widget,
-                "checkbox": checkbox,
-                "prompt": prompt_combo,
-                "target": image_combo,
-            }
-        )
-        self._update_summary()
-        self._update_row_visibility()
 
-    def clear_rows(self) -> None:
-        for row in self._rows:
-            widget = row["widget"]
-            self.layout.removeWidget(widget)
-            widget.deleteLater()
-        self._rows.clear()
-        self._update_summary()
-        self._update_row_visibility()
+class ImageMappingForm(_MappingForm):
+    """Mapping editor for image generation prompts."""
 
-    def set_pairs(self, pairs: list[tuple[str, str, bool]]) -> None:
-        self.clear_rows()
-        if pairs:
-            for prompt_field, image_field, enabled in pairs:
-                self.add_row(prompt_field, image_field, enabled)
-        else:
-            self.add_row()
-        self._update_summary()
-        self._update_row_visibility()
+    def __init__(self, rows: list[tuple[str, str, bool]], card_fields: list[str]):
+        super().__init__(card_fields, "Add Mapping")
+        self._fill_rows(rows)
 
-    def set_master_override(self, master_checked: bool) -> None:
-        self._master_override = master_checked
-        for row in self._rows:
-            checkbox: QCheckBox = row["checkbox"]  # type: ignore[assignment]
-            checkbox.setEnabled(not master_checked)
-        for button in self._control_buttons:
-            button.setEnabled(not master_checked)
-        self._update_summary()
-        self._update_row_visibility()
+    def _make_inputs(
+        self, prompt_field: str, image_field: str
+    ) -> tuple[QWidget, QWidget]:
+        return self._field_combo(prompt_field), self._field_combo(image_field)
+
+    def set_pairs(self, pairs: list[tuple[str, str, bool]]) -> None:
+        """Replace every row, refreshing the summary and visibility once."""
+        self.set_rows(pairs)
 
     def get_pairs(self) -> list[tuple[str, str]]:
         pairs: list[tuple[str, str]] = []
         for row in self._rows:
             checkbox: QCheckBox = row["checkbox"]  # type: ignore[assignment]
-            prompt_widget: QComboBox = row["prompt"]  # type: ignore[assignment]
-            image_widget: QComboBox = row["target"]  # type: ignore[assignment]
-            prompt_value = prompt_widget.currentText().strip()
-            image_value = image_widget.currentText().strip()
+            prompt_value, image_value = self._stripped_values(row)
             if not prompt_value or not image_value:
                 continue
             if self._master_override or checkbox.isChecked():
                 pairs.append((prompt_value, image_value))
         return pairs
 
-    def get_all_rows(self) -> list[tuple[str, str, bool]]:
-        rows: list[tuple[str, str, bool]] = []
-        for row in self._rows:
-            checkbox: QCheckBox = row["checkbox"]  # type: ignore[assignment]
-            prompt_widget: QComboBox = row["prompt"]  # type: ignore[assignment]
-            image_widget: QComboBox = row["target"]  # type: ignore[assignment]
-            rows.append(
-                (
-                    prompt_widget.currentText().strip(),
-                    image_widget.currentText().strip(),
-                    checkbox.isChecked(),
-                )
-            )
-        return rows
-
-    def _set_all(self, value: bool) -> None:
-        if self._master_override:
-            return
-        for row in self._rows:
-            checkbox: QCheckBox = row["checkbox"]  # type: ignore[assignment]
-            checkbox.setChecked(value)
-        self._update_summary()
-        self._update_row_visibility()
-
-    def _invert_all(self) -> None:
-        if self._master_override:
-            return
-        for row in self._rows:
-            checkbox: QCheckBox = row["checkbox"]  # type: ignore[assignment]
-            checkbox.setChecked(not checkbox.isChecked())
-        self._update_summary()
-        self._update_row_visibility()
-
-    def _on_row_updated(self) -> None:
-        self._update_summary()
-        self._update_row_visibility()
-
-    def _update_summary(self) -> None:
-        entries: list[tuple[str, str, bool]] = []
-        for row in self._rows:
-            checkbox: QCheckBox = row["checkbox"]  # type: ignore[assignment]
-            prompt_widget: QComboBox = row["prompt"]  # type: ignore[assignment]
-            target_widget: QComboBox = row["target"]  # type: ignore[assignment]
-            prompt = prompt_widget.currentText().strip()
-            target = target_widget.currentText().strip()
-            if not prompt and not target:
-                continue
-            enabled = bool(prompt and target) and (self._master_override or checkbox.isChecked())
-            entries.append((prompt, target, enabled))
-        if not entries:
-            self._summary_label.setText('Enabled mappings: none configured')
-            return
-        total = len(entries)
-        enabled_entries = [f"{prompt} -> {target}" for prompt, target, enabled in entries if enabled]
-        enabled_count = len(enabled_entries)
-        if enabled_entries:
-            summary = f"Enabled ({enabled_count}/{total}): {', '.join(enabled_entries)}"
-        else:
-            summary = f"Enabled (0/{total}): none"
-        disabled_entries = [f"{prompt} -> {target}" for prompt, target, enabled in entries if not enabled]
-        if disabled_entries:
-            summary = f"{summary} (disabled: {', '.join(disabled_entries)})"
-        self._summary_label.setText(summary)
-
-    def _update_row_visibility(self) -> None:
-        show_enabled_only = self._show_enabled_checkbox.isChecked()
-        for row in self._rows:
-            checkbox: QCheckBox = row["checkbox"]  # type: ignore[assignment]
-            widget: QWidget = row["widget"]  # type: ignore[assignment]
-            visible = True
-            if show_enabled_only and not (self._master_override or checkbox.isChecked()):
-                visible = False
-            widget.setVisible(visible)
-
 
 class AudioMappingForm(ImageMappingForm):
     """Mapping editor for speech synthesis prompts."""
 
-    def add_row(
-        self,
-        prompt_field: str = "",
-        audio_field: str = "",
-        enabled: bool = True,
-    ) -> None:
-        row_widget = QWidget()
-        row_layout = QHBoxLayout(row_widget)
-        row_layout.setContentsMargins(0, 0, 0, 0)
-
-        checkbox = QCheckBox()
-        checkbox.setChecked(enabled)
-        checkbox.setEnabled(not self._master_override)
-        checkbox.stateChanged.connect(lambda _: self._on_row_updated())
-        row_layout.addWidget(checkbox)
-
-        prompt_combo = QComboBox()
-        prompt_combo.setMaximumWidth(self._item_width)
-        prompt_combo.addItems(self._card_fields)
-        prompt_combo.setCurrentText(prompt_field)
-        prompt_combo.currentIndexChanged.connect(lambda _: self._on_row_updated())
-        row_layout.addWidget(prompt_combo)
-
-        audio_combo = QComboBox()
-        audio_combo.setMaximumWidth(self._item_width)
-        audio_combo.addItems(self._card_fields)
-        audio_combo.setCurrentText(audio_field)
-        audio_combo.currentIndexChanged.connect(lambda _: self._on_row_updated())
-        row_layout.addWidget(audio_combo)
-
-        index = self.layout.count() - 1
-        if index < 0:
-            self.layout.addWidget(row_widget)
-        else:
-            self.layout.insertWidget(index, row_widget)
-
-        self._rows.append(
-            {
-                "widget": row_widget,
-                "checkbox": checkbox,
-                "prompt": prompt_combo,
-                "target": audio_combo,
-            }
-        )
-        self._update_summary()
-        self._update_row_visibility()
-
+    def _make_inputs(
+        self, prompt_field: str, audio_field: str
+    ) -> tuple[QWidget, QWidget]:
+        return self._field_combo(prompt_field), self._field_combo(audio_field)
@@ -1,19 +1,29 @@
+from typing import Any, Optional
+
 from aqt.qt import (
     QComboBox,
     QFont,
     QLabel,
     QLineEdit,
+    QPlainTextEdit,
     QSettings,
-    QTextEdit,
 )
 
 
 class UITools:
+    _LABEL_FONT: Optional[QFont] = None
+
     def __init__(self, settings: QSettings, max_width):
-        self.label_font = self.get_label_font()
+        if UITools._LABEL_FONT is None:
+            UITools._LABEL_FONT = self.get_label_font()
+        # QFont is implicitly shared, so every instance can hold the same one.
+        self.label_font = UITools._LABEL_FONT
         self.max_width = max_width
         self.settings = settings
         self.widgets = {}
+        # Value getter per setting, picked once when the widget is created.
+        self._extractors = {}
+        self._cache: dict[str, Any] = {}
 
     def get_label_font(self):
         label_font = QFont()
@@ -21,6 +31,11 @@ class UITools:
         label_font.setPointSize(14)
         return label_font
 
+    def _get(self, setting_name):
+        if setting_name not in self._cache:
+            self._cache[setting_name] = self.settings.value(setting_name)
+        return self._cache[setting_name]
+
     def create_label(self, label_text):
         label = QLabel(label_text)
         label.setFont(self.label_font)
@@ -36,42 +51,49 @@ class UITools:
         combo_box = QComboBox()
         combo_box.setMaximumWidth(self.max_width)
         combo_box.addItems(items)
-        setting_value = self.settings.value(setting_name)
+        setting_value = self._get(setting_name)
         combo_box.setCurrentText(setting_value)
         self.widgets[setting_name] = combo_box
+        self._extractors[setting_name] = QComboBox.currentText
         return combo_box
 
     def create_text_entry(self, setting_name, placeholder=""):
-        setting_value = self.settings.value(setting_name)
+        setting_value = self._get(setting_name)
         if setting_value is None:
             setting_value = ""
         entry = QLineEdit(str(setting_value))
         entry.setPlaceholderText(placeholder)
         entry.setMaximumWidth(self.max_width)
         self.widgets[setting_name] = entry
+        self._extractors[setting_name] = QLineEdit.text
         return entry
 
     def create_text_edit(self, setting_name, placeholder="", max_height=200):
-        text_edit = QTextEdit()
+        text_edit = QPlainTextEdit()
         text_edit.setMinimumSize(self.max_width, max_height)
-        setting_value = self.settings.value(setting_name)
-        text_edit.setText(setting_value or "")
+        setting_value = self._get(setting_name)
+        text_edit.setPlainText(setting_value or "")
         text_edit.setPlaceholderText(placeholder)
         self.widgets[setting_name] = text_edit
+        self._extractors[setting_name] = QPlainTextEdit.toPlainText
         return text_edit
 
     def save_settings(self):
-        settings_values = self.get_settings()
-        for setting_name, value in settings_values.items():
-            self.settings.setValue(setting_name, value)
+        changed = False
+        for setting_name, value in self.get_settings().items():
+            # An unset key reads back as None while its widget reports "";
+            # treat those as equal so opening and closing writes nothing.
+            stored = self._cache.get(setting_name)
+            if (stored if stored is not None else "") != value:
+                self.settings.setValue(setting_name, value)
+                self._cache[setting_name] = value
+                changed = True
+        if changed:
+            self.settings.sync()
 
     def get_settings(self):
-        settings = {}
-        for setting_name, widget in self.widgets.items():
-            if isinstance(widget, QTextEdit):
-                settings[setting_name] = widget.toPlainText()
-            elif isinstance(widget, QLineEdit):
-                settings[setting_name] = widget.text()
-            elif isinstance(widget, QComboBox):
-                settings[setting_name] = widget.currentText()
-        return settings
+        extractors = self._extractors
+        return {
+            setting_name: extractors[setting_name](widget)
+            for setting_name, widget in self.widgets.items()
+        }
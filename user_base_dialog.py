@@ -3,11 +3,11 @@
 from __future__ import annotations
 
 import json
-from typing import Any, Dict, Iterable, Sequence, Tuple
+from typing import Any, Callable, Dict, Iterable, Sequence, Tuple
 
 from anki.notes import Note as AnkiNote
 from aqt.qt import QSettings
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import QObject, Qt, QTimer, pyqtSlot
 from PyQt6.QtGui import QFont
 from PyQt6.QtWidgets import (
     QCheckBox,
@@ -18,9 +18,9 @@ from PyQt6.QtWidgets import (
     QLabel,
     QLineEdit,
     QMessageBox,
+    QPlainTextEdit,
     QPushButton,
     QSpinBox,
-    QTextEdit,
     QScrollArea,
     QVBoxLayout,
     QWidget,
@@ -37,14 +37,257 @@ from .provider_options import (
     TEXT_PROVIDERS,
     TEXT_PROVIDER_DEFAULTS,
 )
-from .settings import SettingsNames
+from .settings import SettingsNames, FALSE_FLAGS, TRUE_STRINGS
 
 IMAGE_MAPPING_SEPARATOR = "->"
 
+# (label, stored value) for the accent pickers.
+_YOUGLISH_ACCENTS = (("US", "us"), ("UK", "uk"), ("Australia", "aus"))
+_OAAD_ACCENTS = (("US", "us"), ("UK", "uk"))
+
+DirtySource = Tuple[str, QObject, str, Callable[[Any], Any]]
+
+
+class _SettingsBatch:
+    """Collects setting writes and applies the changed ones with a single sync.
+
+    ``stored`` holds values known to be in the backing store; entries equal
+    to them are skipped and written ones are recorded there.
+    """
+
+    def __init__(
+        self,
+        settings: QSettings,
+        stored: Dict[str, Any] | None = None,
+    ) -> None:
+        self._settings = settings
+        self._stored = stored if stored is not None else {}
+        self._values: Dict[str, Any] = {}
+
+    def __setitem__(self, name: str, value: Any) -> None:
+        self._values[name] = value
+
+    def __enter__(self) -> "_SettingsBatch":
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        if exc_type is not None:
+            # Leave stored settings untouched rather than half-written.
+            return
+        written = False
+        for name, value in self._values.items():
+            if name in self._stored and self._stored[name] == value:
+                continue
+            self._settings.setValue(name, value)
+            self._stored[name] = value
+            written = True
+        if written:
+            self._settings.sync()
+
+
+def _collect_card_fields(notes: Iterable[AnkiNote]) -> tuple[str, ...]:
+    """Sorted union of field names, reading each note type only once."""
+    fields: set[str] = set()
+    seen_models: set[int] = set()
+    for note in notes:
+        model_id = getattr(note, "mid", None)
+        if model_id is not None:
+            if model_id in seen_models:
+                continue
+            seen_models.add(model_id)
+        fields.update(note.keys())
+    return tuple(sorted(fields))
+
+
+def _stripped_text(widget: QLineEdit) -> str:
+    return widget.text().strip()
+
+
+def _stripped_plain_text(widget: QPlainTextEdit) -> str:
+    return widget.toPlainText().strip()
+
+
+def _mapping_entries(editor: ToggleMappingEditor) -> tuple[tuple[str, str, bool], ...]:
+    return tuple(editor.get_entries())
+
+
+def _combo_data_index(combo: QComboBox) -> Dict[Any, int]:
+    """Map each item's data to its index, built once the combo is populated."""
+    return {combo.itemData(index): index for index in range(combo.count())}
+
+
+def _select_accent(combo: QComboBox, index_map: Dict[Any, int], accent: str) -> None:
+    """Select ``accent`` (falling back to "us") without emitting change signals."""
+    index = index_map.get((accent or "us").lower(), index_map.get("us", -1))
+    if index == -1 or index == combo.currentIndex():
+        return
+    blocked = combo.blockSignals(True)
+    combo.setCurrentIndex(index)
+    combo.blockSignals(blocked)
+
+
+def _plain_label(text: str = "") -> QLabel:
+    """QLabel that skips rich-text detection; none of the panel's labels use markup."""
+    label = QLabel(text)
+    label.setTextFormat(Qt.TextFormat.PlainText)
+    return label
+
+
+def _refresh_reset_button(
+    section: GenerationSection,
+    button: QPushButton,
+    defaults_map: Dict[str, Dict[str, str]],
+) -> None:
+    """Enable a restore-defaults button only when the provider has defaults."""
+    _set_enabled(button, reset_button_enabled(section.provider_combo, defaults_map))
+
+
+def _set_enabled(widget: QWidget, enabled: bool) -> None:
+    """setEnabled that skips widgets whose explicit enabled state already matches.
+
+    WA_ForceDisabled tracks the widget's own setEnabled(False); WA_Disabled is
+    also set by a disabled ancestor, so it cannot tell whether the call is needed.
+    """
+    if widget.testAttribute(Qt.WidgetAttribute.WA_ForceDisabled) == enabled:
+        widget.setEnabled(enabled)
+
 
 class UserBaseDialog(QWidget):
     """Runtime editor that mirrors the configuration manager sections."""
 
+    # (widget attribute, setting name, default, setter) for plain string inputs.
+    _LOAD_TABLE: Tuple[Tuple[str, str, str, str], ...] = (
+        ("api_key_input", SettingsNames.API_KEY_SETTING_NAME, "", "setText"),
+        ("endpoint_input", SettingsNames.ENDPOINT_SETTING_NAME, "", "setText"),
+        ("model_input", SettingsNames.MODEL_SETTING_NAME, "", "setText"),
+        (
+            "system_prompt_input",
+            SettingsNames.SYSTEM_PROMPT_SETTING_NAME,
+            "",
+            "setPlainText",
+        ),
+        (
+            "user_prompt_input",
+            SettingsNames.USER_PROMPT_SETTING_NAME,
+            "",
+            "setPlainText",
+        ),
+        (
+            "image_api_key_input",
+            SettingsNames.IMAGE_API_KEY_SETTING_NAME,
+            "",
+            "setText",
+        ),
+        (
+            "image_endpoint_input",
+            SettingsNames.IMAGE_ENDPOINT_SETTING_NAME,
+            "",
+            "setText",
+        ),
+        ("image_model_input", SettingsNames.IMAGE_MODEL_SETTING_NAME, "", "setText"),
+        (
+            "audio_api_key_input",
+            SettingsNames.AUDIO_API_KEY_SETTING_NAME,
+            "",
+            "setText",
+        ),
+        (
+            "audio_endpoint_input",
+            SettingsNames.AUDIO_ENDPOINT_SETTING_NAME,
+            "",
+            "setText",
+        ),
+        ("audio_model_input", SettingsNames.AUDIO_MODEL_SETTING_NAME, "", "setText"),
+        ("audio_voice_input", SettingsNames.AUDIO_VOICE_SETTING_NAME, "", "setText"),
+        (
+            "audio_format_input",
+            SettingsNames.AUDIO_FORMAT_SETTING_NAME,
+            "wav",
+            "setText",
+        ),
+        (
+            "auto_queue_display_field_input",
+            SettingsNames.AUTO_QUEUE_DISPLAY_FIELD,
+            "",
+            "setText",
+        ),
+        (
+            "schedule_query_input",
+            SettingsNames.SCHEDULE_QUERY_SETTING_NAME,
+            "",
+            "setText",
+        ),
+        (
+            "oaad_source_input",
+            SettingsNames.OAAD_SOURCE_FIELD_SETTING_NAME,
+            "_word",
+            "setText",
+        ),
+        (
+            "oaad_target_input",
+            SettingsNames.OAAD_TARGET_FIELD_SETTING_NAME,
+            "_oaad",
+            "setText",
+        ),
+        (
+            "youglish_source_input",
+            SettingsNames.YOUGLISH_SOURCE_FIELD_SETTING_NAME,
+            "_word",
+            "setText",
+        ),
+        (
+            "youglish_target_input",
+            SettingsNames.YOUGLISH_TARGET_FIELD_SETTING_NAME,
+            "_youglish",
+            "setText",
+        ),
+    )
+
+    # (setting name, captured state key, fallback for empty values) for values
+    # that are stored exactly as captured. None keeps falsy values as they are.
+    _SAVE_TABLE: Tuple[Tuple[str, str, Any], ...] = (
+        (SettingsNames.ENDPOINT_SETTING_NAME, "text_endpoint", None),
+        (SettingsNames.MODEL_SETTING_NAME, "text_model", None),
+        (SettingsNames.SYSTEM_PROMPT_SETTING_NAME, "system_prompt", None),
+        (SettingsNames.USER_PROMPT_SETTING_NAME, "user_prompt", None),
+        (SettingsNames.ENABLE_TEXT_GENERATION_SETTING_NAME, "text_enabled", None),
+        (SettingsNames.IMAGE_ENDPOINT_SETTING_NAME, "image_endpoint", None),
+        (SettingsNames.IMAGE_MODEL_SETTING_NAME, "image_model", None),
+        (SettingsNames.ENABLE_IMAGE_GENERATION_SETTING_NAME, "image_enabled", None),
+        (SettingsNames.AUDIO_ENDPOINT_SETTING_NAME, "audio_endpoint", None),
+        (SettingsNames.AUDIO_MODEL_SETTING_NAME, "audio_model", None),
+        (SettingsNames.AUDIO_VOICE_SETTING_NAME, "audio_voice", None),
+        (SettingsNames.AUDIO_FORMAT_SETTING_NAME, "audio_format", "wav"),
+        (SettingsNames.ENABLE_AUDIO_GENERATION_SETTING_NAME, "audio_enabled", None),
+        (SettingsNames.AUTO_GENERATE_ON_ADD_SETTING_NAME, "auto_generate_on_add", None),
+        (SettingsNames.AUTO_QUEUE_DISPLAY_FIELD, "auto_queue_display_field", None),
+        (SettingsNames.AUTO_QUEUE_SILENT_SETTING_NAME, "auto_queue_silent", None),
+        (SettingsNames.SCHEDULE_ENABLED_SETTING_NAME, "schedule_enabled", None),
+        (SettingsNames.SCHEDULE_QUERY_SETTING_NAME, "schedule_query", None),
+        (SettingsNames.SCHEDULE_INTERVAL_MIN_SETTING_NAME, "schedule_interval", None),
+        (SettingsNames.SCHEDULE_BATCH_SIZE_SETTING_NAME, "schedule_batch_size", None),
+        (SettingsNames.SCHEDULE_DAILY_LIMIT_SETTING_NAME, "schedule_daily_limit", None),
+        (
+            SettingsNames.SCHEDULE_NOTICE_SECONDS_SETTING_NAME,
+            "schedule_notice_seconds",
+            None,
+        ),
+        (SettingsNames.OAAD_ENABLED_SETTING_NAME, "oaad_enabled", None),
+        (SettingsNames.OAAD_SOURCE_FIELD_SETTING_NAME, "oaad_source", "_word"),
+        (SettingsNames.OAAD_TARGET_FIELD_SETTING_NAME, "oaad_target", "_oaad"),
+        (SettingsNames.OAAD_ACCENT_SETTING_NAME, "oaad_accent", "us"),
+        (SettingsNames.OAAD_OVERWRITE_SETTING_NAME, "oaad_overwrite", None),
+        (SettingsNames.YOUGLISH_ENABLED_SETTING_NAME, "youglish_enabled", None),
+        (SettingsNames.YOUGLISH_SOURCE_FIELD_SETTING_NAME, "youglish_source", "_word"),
+        (
+            SettingsNames.YOUGLISH_TARGET_FIELD_SETTING_NAME,
+            "youglish_target",
+            "_youglish",
+        ),
+        (SettingsNames.YOUGLISH_ACCENT_SETTING_NAME, "youglish_accent", "us"),
+        (SettingsNames.YOUGLISH_OVERWRITE_SETTING_NAME, "youglish_overwrite", None),
+    )
+
     def __init__(self, app_settings: QSettings, selected_notes: list[AnkiNote], active_config=None):
         super().__init__()
         self.app_settings = app_settings
@@ -53,12 +296,18 @@ class UserBaseDialog(QWidget):
         self._text_api_keys: Dict[str, str] = {}
         self._image_api_keys: Dict[str, str] = {}
         self._audio_api_keys: Dict[str, str] = {}
-        self.card_fields = sorted(
-            {field for note in selected_notes for field in note.keys()}
-        )
+        self.card_fields = _collect_card_fields(selected_notes)
         self._loading = True
         self._dirty = False
         self._initial_state: Dict[str, Any] = {}
+        self._baseline: Dict[QObject, Any] = {}
+        self._dirty_set: set[QObject] = set()
+        self._dirty_sources: list[DirtySource] = []
+        self._value_getters: Dict[QObject, Callable[[Any], Any]] = {}
+        self._all_input_widgets: list[QObject] = []
+        self._present_keys: frozenset[str] | None = None
+        self._loaded_snapshot: Dict[str, Any] = {}
+        self._title_font: QFont | None = None
         self._provider_indices: Dict[str, int] = {
             "text": -1,
             "image": -1,
@@ -68,9 +317,28 @@ class UserBaseDialog(QWidget):
             self._text_api_keys = dict(self._active_config.text_provider_api_keys or {})
             self._image_api_keys = dict(self._active_config.image_provider_api_keys or {})
             self._audio_api_keys = dict(self._active_config.audio_provider_api_keys or {})
-        self._build_ui()
-        self._install_dirty_watchers()
-        self._load_from_settings()
+        # Edits landing in the same event-loop pass are checked together.
+        self._pending_dirty: set[QObject] = set()
+        self._dirty_check_timer = QTimer(self)
+        self._dirty_check_timer.setSingleShot(True)
+        self._dirty_check_timer.setInterval(0)
+        self._dirty_check_timer.timeout.connect(self._flush_dirty_checks)
+        self.setUpdatesEnabled(False)
+        blocked: list[tuple[QObject, bool]] = []
+        try:
+            self._build_ui()
+            self._install_dirty_watchers()
+            # The loader refreshes dependent state itself, so nothing needs the
+            # signals its setters would emit.
+            blocked = [
+                (widget, widget.blockSignals(True))
+                for widget in self._all_input_widgets
+            ]
+            self._load_from_settings()
+        finally:
+            for widget, was_blocked in blocked:
+                widget.blockSignals(was_blocked)
+            self.setUpdatesEnabled(True)
         self._loading = False
         self._reset_dirty_state()
 
@@ -92,12 +360,14 @@ class UserBaseDialog(QWidget):
         container_layout.setContentsMargins(16, 12, 16, 12)
         container_layout.setSpacing(12)
 
-        self.selection_label = QLabel(
-            f"{len(self.selected_notes)} notes selected." if self.selected_notes else "No notes selected"
+        self.selection_label = _plain_label(
+            f"{len(self.selected_notes)} notes selected."
+            if self.selected_notes
+            else "No notes selected"
         )
         container_layout.addWidget(self.selection_label)
 
-        self.note_type_status = QLabel()
+        self.note_type_status = _plain_label()
         self.note_type_status.setWordWrap(True)
         self.note_type_status.setStyleSheet("color: #c0392b;")
         self.note_type_status.hide()
@@ -109,7 +379,7 @@ class UserBaseDialog(QWidget):
         auto_form.addRow(self.auto_generate_checkbox)
         self.auto_queue_display_field_input = QLineEdit()
         self.auto_queue_display_field_input.setPlaceholderText("_word")
-        auto_form.addRow(QLabel("Display field (status):"), self.auto_queue_display_field_input)
+        auto_form.addRow("Display field (status):", self.auto_queue_display_field_input)
         self.auto_queue_silent_checkbox = QCheckBox("Run auto-queue silently (no popup)")
         auto_form.addRow(self.auto_queue_silent_checkbox)
         container_layout.addWidget(self.auto_group)
@@ -120,21 +390,21 @@ class UserBaseDialog(QWidget):
         schedule_form.addRow(self.schedule_enable_checkbox)
         self.schedule_query_input = QLineEdit()
         self.schedule_query_input.setPlaceholderText("Anki search query (e.g. tag:ai_pending)")
-        schedule_form.addRow(QLabel("Search query:"), self.schedule_query_input)
+        schedule_form.addRow("Search query:", self.schedule_query_input)
         self.schedule_interval_input = QSpinBox()
         self.schedule_interval_input.setRange(1, 24 * 60)
         self.schedule_interval_input.setSuffix(" min")
-        schedule_form.addRow(QLabel("Interval:"), self.schedule_interval_input)
+        schedule_form.addRow("Interval:", self.schedule_interval_input)
         self.schedule_batch_size_input = QSpinBox()
         self.schedule_batch_size_input.setRange(1, 500)
-        schedule_form.addRow(QLabel("Max per batch:"), self.schedule_batch_size_input)
+        schedule_form.addRow("Max per batch:", self.schedule_batch_size_input)
         self.schedule_daily_limit_input = QSpinBox()
         self.schedule_daily_limit_input.setRange(1, 5000)
-        schedule_form.addRow(QLabel("Daily limit:"), self.schedule_daily_limit_input)
+        schedule_form.addRow("Daily limit:", self.schedule_daily_limit_input)
         self.schedule_notice_seconds_input = QSpinBox()
         self.schedule_notice_seconds_input.setRange(0, 600)
         self.schedule_notice_seconds_input.setSuffix(" sec")
-        schedule_form.addRow(QLabel("Pre-run warning:"), self.schedule_notice_seconds_input)
+        schedule_form.addRow("Pre-run warning:", self.schedule_notice_seconds_input)
         container_layout.addWidget(self.schedule_group)
 
         self.retry_section = RetrySection()
@@ -154,41 +424,36 @@ class UserBaseDialog(QWidget):
         )
         self.text_section.add_provider_selector(TEXT_PROVIDERS)
         self.text_defaults_button = QPushButton("Restore defaults")
-        self.text_defaults_button.clicked.connect(
-            lambda: self._apply_text_provider_defaults(force=True)
-        )
+        self.text_defaults_button.clicked.connect(self._on_text_defaults_clicked)
         self.text_section.add_provider_reset_button(self.text_defaults_button)
         if self.text_section.provider_combo is not None:
             self.text_section.provider_combo.currentIndexChanged.connect(
-                lambda index: self._on_provider_combo_changed("text", index)
+                self._on_text_provider_changed
             )
-        self._update_text_reset_button()
 
         text_creds_form = QFormLayout()
         text_creds_form.setFieldGrowthPolicy(QFormLayout.FieldGrowthPolicy.ExpandingFieldsGrow)
         self.api_key_input = QLineEdit()
         self.api_key_input.setPlaceholderText("API key")
-        text_creds_form.addRow(QLabel("API Key:"), self.api_key_input)
+        text_creds_form.addRow("API Key:", self.api_key_input)
         self.endpoint_input = QLineEdit()
         self.endpoint_input.setPlaceholderText("Endpoint (optional)")
-        text_creds_form.addRow(QLabel("Endpoint:"), self.endpoint_input)
+        text_creds_form.addRow("Endpoint:", self.endpoint_input)
         self.model_input = QLineEdit()
         self.model_input.setPlaceholderText("Model name")
-        text_creds_form.addRow(QLabel("Model:"), self.model_input)
+        text_creds_form.addRow("Model:", self.model_input)
         self.text_section.add_form_layout(text_creds_form)
 
         text_prompt_form = QFormLayout()
         text_prompt_form.setFieldGrowthPolicy(
             QFormLayout.FieldGrowthPolicy.ExpandingFieldsGrow
         )
-        self.system_prompt_input = QTextEdit()
-        self.system_prompt_input.setAcceptRichText(False)
+        self.system_prompt_input = QPlainTextEdit()
         self.system_prompt_input.setMinimumHeight(80)
-        text_prompt_form.addRow(QLabel("System Prompt:"), self.system_prompt_input)
-        self.user_prompt_input = QTextEdit()
-        self.user_prompt_input.setAcceptRichText(False)
+        text_prompt_form.addRow("System Prompt:", self.system_prompt_input)
+        self.user_prompt_input = QPlainTextEdit()
         self.user_prompt_input.setMinimumHeight(120)
-        text_prompt_form.addRow(QLabel("User Prompt:"), self.user_prompt_input)
+        text_prompt_form.addRow("User Prompt:", self.user_prompt_input)
         self.text_section.add_form_layout(text_prompt_form)
         container_layout.addWidget(self.text_section)
 
@@ -206,27 +471,24 @@ class UserBaseDialog(QWidget):
         )
         self.image_section.add_provider_selector(IMAGE_PROVIDERS)
         self.image_defaults_button = QPushButton("Restore defaults")
-        self.image_defaults_button.clicked.connect(
-            lambda: self._apply_image_provider_defaults(force=True)
-        )
+        self.image_defaults_button.clicked.connect(self._on_image_defaults_clicked)
         self.image_section.add_provider_reset_button(self.image_defaults_button)
         if self.image_section.provider_combo is not None:
             self.image_section.provider_combo.currentIndexChanged.connect(
-                lambda index: self._on_provider_combo_changed("image", index)
+                self._on_image_provider_changed
             )
-        self._update_image_reset_button()
 
         image_form = QFormLayout()
         image_form.setFieldGrowthPolicy(QFormLayout.FieldGrowthPolicy.ExpandingFieldsGrow)
         self.image_api_key_input = QLineEdit()
         self.image_api_key_input.setPlaceholderText("Image API key")
-        image_form.addRow(QLabel("Image API Key:"), self.image_api_key_input)
+        image_form.addRow("Image API Key:", self.image_api_key_input)
         self.image_endpoint_input = QLineEdit()
         self.image_endpoint_input.setPlaceholderText("Image endpoint")
-        image_form.addRow(QLabel("Image Endpoint:"), self.image_endpoint_input)
+        image_form.addRow("Image Endpoint:", self.image_endpoint_input)
         self.image_model_input = QLineEdit()
         self.image_model_input.setPlaceholderText("Image model")
-        image_form.addRow(QLabel("Image Model:"), self.image_model_input)
+        image_form.addRow("Image Model:", self.image_model_input)
         self.image_section.add_form_layout(image_form)
         container_layout.addWidget(self.image_section)
 
@@ -244,33 +506,30 @@ class UserBaseDialog(QWidget):
         )
         self.audio_section.add_provider_selector(AUDIO_PROVIDERS)
         self.audio_defaults_button = QPushButton("Restore defaults")
-        self.audio_defaults_button.clicked.connect(
-            lambda: self._apply_audio_provider_defaults(force=True)
-        )
+        self.audio_defaults_button.clicked.connect(self._on_audio_defaults_clicked)
         self.audio_section.add_provider_reset_button(self.audio_defaults_button)
         if self.audio_section.provider_combo is not None:
             self.audio_section.provider_combo.currentIndexChanged.connect(
-                lambda index: self._on_provider_combo_changed("audio", index)
+                self._on_audio_provider_changed
             )
-        self._update_audio_reset_button()
 
         audio_form = QFormLayout()
         audio_form.setFieldGrowthPolicy(QFormLayout.FieldGrowthPolicy.ExpandingFieldsGrow)
         self.audio_api_key_input = QLineEdit()
         self.audio_api_key_input.setPlaceholderText("Speech API key")
-        audio_form.addRow(QLabel("Speech API Key:"), self.audio_api_key_input)
+        audio_form.addRow("Speech API Key:", self.audio_api_key_input)
         self.audio_endpoint_input = QLineEdit()
         self.audio_endpoint_input.setPlaceholderText("Speech endpoint")
-        audio_form.addRow(QLabel("Speech Endpoint:"), self.audio_endpoint_input)
+        audio_form.addRow("Speech Endpoint:", self.audio_endpoint_input)
         self.audio_model_input = QLineEdit()
         self.audio_model_input.setPlaceholderText("Speech model")
-        audio_form.addRow(QLabel("Speech Model:"), self.audio_model_input)
+        audio_form.addRow("Speech Model:", self.audio_model_input)
         self.audio_voice_input = QLineEdit()
         self.audio_voice_input.setPlaceholderText("Voice preference")
-        audio_form.addRow(QLabel("Speech Voice:"), self.audio_voice_input)
+        audio_form.addRow("Speech Voice:", self.audio_voice_input)
         self.audio_format_input = QLineEdit()
         self.audio_format_input.setPlaceholderText("wav")
-        audio_form.addRow(QLabel("Speech Format:"), self.audio_format_input)
+        audio_form.addRow("Speech Format:", self.audio_format_input)
         self.audio_section.add_form_layout(audio_form)
         container_layout.addWidget(self.audio_section)
 
@@ -278,21 +537,21 @@ class UserBaseDialog(QWidget):
         self.youglish_group, youglish_form = self._create_titled_group("YouGlish links")
         youglish_form.setFieldGrowthPolicy(QFormLayout.FieldGrowthPolicy.ExpandingFieldsGrow)
         self.youglish_enable_checkbox = QCheckBox("Enable YouGlish link generation")
-        self.youglish_enable_checkbox.stateChanged.connect(
-            lambda _: self._update_youglish_enabled_state()
+        self.youglish_enable_checkbox.toggled.connect(
+            self._update_youglish_enabled_state
         )
         youglish_form.addRow(self.youglish_enable_checkbox)
         self.youglish_source_input = QLineEdit()
         self.youglish_source_input.setPlaceholderText("_word")
-        youglish_form.addRow(QLabel("Source field:"), self.youglish_source_input)
+        youglish_form.addRow("Source field:", self.youglish_source_input)
         self.youglish_target_input = QLineEdit()
         self.youglish_target_input.setPlaceholderText("_youglish")
-        youglish_form.addRow(QLabel("Target field:"), self.youglish_target_input)
+        youglish_form.addRow("Target field:", self.youglish_target_input)
         self.youglish_accent_combo = QComboBox()
-        self.youglish_accent_combo.addItem("US", "us")
-        self.youglish_accent_combo.addItem("UK", "uk")
-        self.youglish_accent_combo.addItem("Australia", "aus")
-        youglish_form.addRow(QLabel("Accent:"), self.youglish_accent_combo)
+        for label, accent in _YOUGLISH_ACCENTS:
+            self.youglish_accent_combo.addItem(label, accent)
+        self._youglish_accent_index = _combo_data_index(self.youglish_accent_combo)
+        youglish_form.addRow("Accent:", self.youglish_accent_combo)
         self.youglish_overwrite_checkbox = QCheckBox("Always overwrite existing value")
         youglish_form.addRow(self.youglish_overwrite_checkbox)
         container_layout.addWidget(self.youglish_group)
@@ -301,104 +560,236 @@ class UserBaseDialog(QWidget):
         self.oaad_group, oaad_form = self._create_titled_group("OAAD links")
         oaad_form.setFieldGrowthPolicy(QFormLayout.FieldGrowthPolicy.ExpandingFieldsGrow)
         self.oaad_enable_checkbox = QCheckBox("Enable OAAD link generation")
-        self.oaad_enable_checkbox.stateChanged.connect(
-            lambda _: self._update_oaad_enabled_state()
-        )
+        self.oaad_enable_checkbox.toggled.connect(self._update_oaad_enabled_state)
         oaad_form.addRow(self.oaad_enable_checkbox)
         self.oaad_source_input = QLineEdit()
         self.oaad_source_input.setPlaceholderText("_word")
-        oaad_form.addRow(QLabel("Source field:"), self.oaad_source_input)
+        oaad_form.addRow("Source field:", self.oaad_source_input)
         self.oaad_target_input = QLineEdit()
         self.oaad_target_input.setPlaceholderText("_oaad")
-        oaad_form.addRow(QLabel("Target field:"), self.oaad_target_input)
+        oaad_form.addRow("Target field:", self.oaad_target_input)
         self.oaad_accent_combo = QComboBox()
-        self.oaad_accent_combo.addItem("US", "us")
-        self.oaad_accent_combo.addItem("UK", "uk")
-        oaad_form.addRow(QLabel("Accent:"), self.oaad_accent_combo)
+        for label, accent in _OAAD_ACCENTS:
+            self.oaad_accent_combo.addItem(label, accent)
+        self._oaad_accent_index = _combo_data_index(self.oaad_accent_combo)
+        oaad_form.addRow("Accent:", self.oaad_accent_combo)
         self.oaad_overwrite_checkbox = QCheckBox("Always overwrite existing value")
         oaad_form.addRow(self.oaad_overwrite_checkbox)
         container_layout.addWidget(self.oaad_group)
 
         # Ensure mapping editors respond to enable toggles
-        self.text_section.enable_checkbox.stateChanged.connect(
-            lambda state: self.text_mapping_editor.set_global_enabled(
-                Qt.CheckState(state) == Qt.CheckState.Checked
-            )
-        )
-        self.image_section.enable_checkbox.stateChanged.connect(
-            lambda state: self.image_mapping_editor.set_global_enabled(
-                Qt.CheckState(state) == Qt.CheckState.Checked
-            )
-        )
-        self.audio_section.enable_checkbox.stateChanged.connect(
-            lambda state: self.audio_mapping_editor.set_global_enabled(
-                Qt.CheckState(state) == Qt.CheckState.Checked
-            )
-        )
+        self.text_section.enable_checkbox.toggled.connect(self._on_text_enabled_changed)
+        self.image_section.enable_checkbox.toggled.connect(
+            self._on_image_enabled_changed
+        )
+        self.audio_section.enable_checkbox.toggled.connect(
+            self._on_audio_enabled_changed
+        )
+
+        # kind -> (section, reset-button refresh, key map, key input, defaults)
+        self._provider_dispatch: Dict[str, Tuple[Any, ...]] = {
+            "text": (
+                self.text_section,
+                self._update_text_reset_button,
+                self._text_api_keys,
+                self.api_key_input,
+                self._apply_text_provider_defaults,
+            ),
+            "image": (
+                self.image_section,
+                self._update_image_reset_button,
+                self._image_api_keys,
+                self.image_api_key_input,
+                self._apply_image_provider_defaults,
+            ),
+            "audio": (
+                self.audio_section,
+                self._update_audio_reset_button,
+                self._audio_api_keys,
+                self.audio_api_key_input,
+                self._apply_audio_provider_defaults,
+            ),
+        }
+
+        self._dirty_sources = self._build_dirty_sources()
+        self._all_input_widgets = [widget for _, widget, _, _ in self._dirty_sources]
+
+    def _build_dirty_sources(self) -> list[DirtySource]:
+        """List every watched input as (state key, widget, change signal, getter)."""
+        edited, state_changed = "textChanged", "stateChanged"
+        picked, stepped = "currentIndexChanged", "valueChanged"
+        checked, data = QCheckBox.isChecked, QComboBox.currentData
+        sources: list[DirtySource] = [
+            ("text_provider", self.text_section.provider_combo, picked, data),
+            ("image_provider", self.image_section.provider_combo, picked, data),
+            ("audio_provider", self.audio_section.provider_combo, picked, data),
+            # Retry controls
+            (
+                "retry_limit_text",
+                self.retry_section.retry_limit_input,
+                edited,
+                _stripped_text,
+            ),
+            (
+                "retry_delay_text",
+                self.retry_section.retry_delay_input,
+                edited,
+                _stripped_text,
+            ),
+            # Section toggles
+            ("text_enabled", self.text_section.enable_checkbox, state_changed, checked),
+            (
+                "image_enabled",
+                self.image_section.enable_checkbox,
+                state_changed,
+                checked,
+            ),
+            (
+                "audio_enabled",
+                self.audio_section.enable_checkbox,
+                state_changed,
+                checked,
+            ),
+            # Mapping editors
+            (
+                "text_mappings",
+                self.text_mapping_editor,
+                "rowsChanged",
+                _mapping_entries,
+            ),
+            (
+                "image_mappings",
+                self.image_mapping_editor,
+                "rowsChanged",
+                _mapping_entries,
+            ),
+            (
+                "audio_mappings",
+                self.audio_mapping_editor,
+                "rowsChanged",
+                _mapping_entries,
+            ),
+            # Text provider inputs
+            ("text_api_key", self.api_key_input, edited, _stripped_text),
+            ("text_endpoint", self.endpoint_input, edited, _stripped_text),
+            ("text_model", self.model_input, edited, _stripped_text),
+            ("system_prompt", self.system_prompt_input, edited, _stripped_plain_text),
+            ("user_prompt", self.user_prompt_input, edited, _stripped_plain_text),
+            # Image provider inputs
+            ("image_api_key", self.image_api_key_input, edited, _stripped_text),
+            ("image_endpoint", self.image_endpoint_input, edited, _stripped_text),
+            ("image_model", self.image_model_input, edited, _stripped_text),
+            # Audio provider inputs
+            ("audio_api_key", self.audio_api_key_input, edited, _stripped_text),
+            ("audio_endpoint", self.audio_endpoint_input, edited, _stripped_text),
+            ("audio_model", self.audio_model_input, edited, _stripped_text),
+            ("audio_voice", self.audio_voice_input, edited, _stripped_text),
+            ("audio_format", self.audio_format_input, edited, _stripped_text),
+            # YouGlish inputs
+            ("youglish_enabled", self.youglish_enable_checkbox, state_changed, checked),
+            ("youglish_source", self.youglish_source_input, edited, _stripped_text),
+            ("youglish_target", self.youglish_target_input, edited, _stripped_text),
+            ("youglish_accent", self.youglish_accent_combo, picked, data),
+            (
+                "youglish_overwrite",
+                self.youglish_overwrite_checkbox,
+                state_changed,
+                checked,
+            ),
+            # OAAD inputs
+            ("oaad_enabled", self.oaad_enable_checkbox, state_changed, checked),
+            ("oaad_source", self.oaad_source_input, edited, _stripped_text),
+            ("oaad_target", self.oaad_target_input, edited, _stripped_text),
+            ("oaad_accent", self.oaad_accent_combo, picked, data),
+            ("oaad_overwrite", self.oaad_overwrite_checkbox, state_changed, checked),
+            # Auto/schedule inputs
+            (
+                "auto_generate_on_add",
+                self.auto_generate_checkbox,
+                state_changed,
+                checked,
+            ),
+            (
+                "auto_queue_display_field",
+                self.auto_queue_display_field_input,
+                edited,
+                _stripped_text,
+            ),
+            (
+                "auto_queue_silent",
+                self.auto_queue_silent_checkbox,
+                state_changed,
+                checked,
+            ),
+            ("schedule_enabled", self.schedule_enable_checkbox, state_changed, checked),
+            ("schedule_query", self.schedule_query_input, edited, _stripped_text),
+            (
+                "schedule_interval",
+                self.schedule_interval_input,
+                stepped,
+                QSpinBox.value,
+            ),
+            (
+                "schedule_batch_size",
+                self.schedule_batch_size_input,
+                stepped,
+                QSpinBox.value,
+            ),
+            (
+                "schedule_daily_limit",
+                self.schedule_daily_limit_input,
+                stepped,
+                QSpinBox.value,
+            ),
+            (
+                "schedule_notice_seconds",
+                self.schedule_notice_seconds_input,
+                stepped,
+                QSpinBox.value,
+            ),
+        ]
+        return [source for source in sources if source[1] is not None]
 
     def _install_dirty_watchers(self) -> None:
-        # Retry controls
-        self.retry_section.retry_limit_input.textChanged.connect(self._on_field_modified)
-        self.retry_section.retry_delay_input.textChanged.connect(self._on_field_modified)
-
-        # Section toggles
-        self.text_section.enable_checkbox.stateChanged.connect(self._on_field_modified)
-        self.image_section.enable_checkbox.stateChanged.connect(self._on_field_modified)
-        self.audio_section.enable_checkbox.stateChanged.connect(self._on_field_modified)
-
-        # Mapping editors
-        self.text_mapping_editor.rowsChanged.connect(self._on_field_modified)
-        self.image_mapping_editor.rowsChanged.connect(self._on_field_modified)
-        self.audio_mapping_editor.rowsChanged.connect(self._on_field_modified)
-
-        # Text provider inputs
-        self.api_key_input.textChanged.connect(self._on_field_modified)
-        self.endpoint_input.textChanged.connect(self._on_field_modified)
-        self.model_input.textChanged.connect(self._on_field_modified)
-        self.system_prompt_input.textChanged.connect(self._on_field_modified)
-        self.user_prompt_input.textChanged.connect(self._on_field_modified)
-
-        # Image provider inputs
-        self.image_api_key_input.textChanged.connect(self._on_field_modified)
-        self.image_endpoint_input.textChanged.connect(self._on_field_modified)
-        self.image_model_input.textChanged.connect(self._on_field_modified)
-
-        # Audio provider inputs
-        self.audio_api_key_input.textChanged.connect(self._on_field_modified)
-        self.audio_endpoint_input.textChanged.connect(self._on_field_modified)
-        self.audio_model_input.textChanged.connect(self._on_field_modified)
-        self.audio_voice_input.textChanged.connect(self._on_field_modified)
-        self.audio_format_input.textChanged.connect(self._on_field_modified)
-        # YouGlish inputs
-        self.youglish_enable_checkbox.stateChanged.connect(self._on_field_modified)
-        self.youglish_source_input.textChanged.connect(self._on_field_modified)
-        self.youglish_target_input.textChanged.connect(self._on_field_modified)
-        self.youglish_accent_combo.currentIndexChanged.connect(self._on_field_modified)
-        self.youglish_overwrite_checkbox.stateChanged.connect(self._on_field_modified)
-        # OAAD inputs
-        self.oaad_enable_checkbox.stateChanged.connect(self._on_field_modified)
-        self.oaad_source_input.textChanged.connect(self._on_field_modified)
-        self.oaad_target_input.textChanged.connect(self._on_field_modified)
-        self.oaad_accent_combo.currentIndexChanged.connect(self._on_field_modified)
-        self.oaad_overwrite_checkbox.stateChanged.connect(self._on_field_modified)
-        # Auto/schedule inputs
-        self.auto_generate_checkbox.stateChanged.connect(self._on_field_modified)
-        self.auto_queue_display_field_input.textChanged.connect(self._on_field_modified)
-        self.auto_queue_silent_checkbox.stateChanged.connect(self._on_field_modified)
-        self.schedule_enable_checkbox.stateChanged.connect(self._on_field_modified)
-        self.schedule_query_input.textChanged.connect(self._on_field_modified)
-        self.schedule_interval_input.valueChanged.connect(self._on_field_modified)
-        self.schedule_batch_size_input.valueChanged.connect(self._on_field_modified)
-        self.schedule_daily_limit_input.valueChanged.connect(self._on_field_modified)
-        self.schedule_notice_seconds_input.valueChanged.connect(self._on_field_modified)
-
-    def _on_field_modified(self, *args: object) -> None:
+        self._value_getters = {
+            widget: getter for _, widget, _, getter in self._dirty_sources
+        }
+        for _, widget, signal_name, _ in self._dirty_sources:
+            getattr(widget, signal_name).connect(self._on_field_modified)
+
+    @pyqtSlot()
+    def _on_field_modified(self) -> None:
         if self._loading:
             return
-        self._mark_dirty()
+        widget = self.sender()
+        if widget not in self._value_getters:
+            self._mark_dirty()
+            return
+        self._pending_dirty.add(widget)
+        if not self._dirty_check_timer.isActive():
+            self._dirty_check_timer.start()
+
+    @pyqtSlot()
+    def _flush_dirty_checks(self) -> None:
+        self._dirty_check_timer.stop()
+        pending, self._pending_dirty = self._pending_dirty, set()
+        # Only the widgets that changed are compared against their baselines.
+        for widget in pending:
+            if self._value_getters[widget](widget) != self._baseline[widget]:
+                self._dirty_set.add(widget)
+            else:
+                self._dirty_set.discard(widget)
+        self._dirty = bool(self._dirty_set)
 
     def _reset_dirty_state(self) -> None:
         self._initial_state = self._capture_state()
+        self._baseline = {
+            widget: self._initial_state[key]
+            for key, widget, _, _ in self._dirty_sources
+        }
+        self._dirty_set.clear()
+        self._pending_dirty.clear()
+        self._dirty_check_timer.stop()
         self._dirty = False
         self._provider_indices["text"] = (
             self.text_section.provider_combo.currentIndex()
@@ -417,63 +808,34 @@ class UserBaseDialog(QWidget):
         )
 
     def _mark_dirty(self) -> None:
-        self._dirty = self._capture_state() != self._initial_state
+        self._pending_dirty.clear()
+        self._dirty_check_timer.stop()
+        getters = self._value_getters
+        self._dirty_set = {
+            widget
+            for widget, value in self._baseline.items()
+            if getters[widget](widget) != value
+        }
+        self._dirty = bool(self._dirty_set)
 
     def _capture_state(self) -> Dict[str, Any]:
-        text_provider = self.text_section.provider()
-        image_provider = self.image_section.provider()
-        audio_provider = self.audio_section.provider()
-        return {
-            "retry_limit_text": self.retry_section.retry_limit_input.text().strip(),
-            "retry_delay_text": self.retry_section.retry_delay_input.text().strip(),
-            "text_enabled": self.text_section.is_enabled(),
-            "text_provider": text_provider,
-            "text_mappings": tuple(self.text_mapping_editor.get_entries()),
-            "text_api_key": self.api_key_input.text().strip(),
-            "text_endpoint": self.endpoint_input.text().strip(),
-            "text_model": self.model_input.text().strip(),
-            "system_prompt": self.system_prompt_input.toPlainText().strip(),
-            "user_prompt": self.user_prompt_input.toPlainText().strip(),
-            "image_enabled": self.image_section.is_enabled(),
-            "image_provider": image_provider,
-            "image_mappings": tuple(self.image_mapping_editor.get_entries()),
-            "image_api_key": self.image_api_key_input.text().strip(),
-            "image_endpoint": self.image_endpoint_input.text().strip(),
-            "image_model": self.image_model_input.text().strip(),
-            "audio_enabled": self.audio_section.is_enabled(),
-            "audio_provider": audio_provider,
-            "audio_mappings": tuple(self.audio_mapping_editor.get_entries()),
-            "audio_api_key": self.audio_api_key_input.text().strip(),
-            "audio_endpoint": self.audio_endpoint_input.text().strip(),
-            "audio_model": self.audio_model_input.text().strip(),
-            "audio_voice": self.audio_voice_input.text().strip(),
-            "audio_format": self.audio_format_input.text().strip(),
-            "text_provider_key": self._text_api_keys.get(text_provider[0], ""),
-            "image_provider_key": self._image_api_keys.get(image_provider[0], ""),
-            "audio_provider_key": self._audio_api_keys.get(audio_provider[0], ""),
-            "auto_generate_on_add": self.auto_generate_checkbox.isChecked(),
-            "oaad_enabled": self.oaad_enable_checkbox.isChecked(),
-            "oaad_source": self.oaad_source_input.text().strip(),
-            "oaad_target": self.oaad_target_input.text().strip(),
-            "oaad_accent": self.oaad_accent_combo.currentData(),
-            "oaad_overwrite": self.oaad_overwrite_checkbox.isChecked(),
-            "youglish_enabled": self.youglish_enable_checkbox.isChecked(),
-            "youglish_source": self.youglish_source_input.text().strip(),
-            "youglish_target": self.youglish_target_input.text().strip(),
-            "youglish_accent": self.youglish_accent_combo.currentData(),
-            "youglish_overwrite": self.youglish_overwrite_checkbox.isChecked(),
-            "auto_queue_display_field": self.auto_queue_display_field_input.text().strip(),
-            "auto_queue_silent": self.auto_queue_silent_checkbox.isChecked(),
-            "schedule_enabled": self.schedule_enable_checkbox.isChecked(),
-            "schedule_query": self.schedule_query_input.text().strip(),
-            "schedule_interval": self.schedule_interval_input.value(),
-            "schedule_batch_size": self.schedule_batch_size_input.value(),
-            "schedule_daily_limit": self.schedule_daily_limit_input.value(),
-            "schedule_notice_seconds": self.schedule_notice_seconds_input.value(),
-        }
+        state = {key: getter(widget) for key, widget, _, getter in self._dirty_sources}
+        state["text_provider_key"] = self._text_api_keys.get(
+            state.get("text_provider"), ""
+        )
+        state["image_provider_key"] = self._image_api_keys.get(
+            state.get("image_provider"), ""
+        )
+        state["audio_provider_key"] = self._audio_api_keys.get(
+            state.get("audio_provider"), ""
+        )
+        return state
 
     def _has_unsaved_changes(self) -> bool:
-        return False if self._loading else self._dirty
+        if self._loading:
+            return False
+        self._flush_dirty_checks()
+        return self._dirty
 
     def _confirm_discard_changes(self, context: str) -> bool:
         if not self._has_unsaved_changes():
@@ -486,25 +848,35 @@ class UserBaseDialog(QWidget):
         )
         return response == QMessageBox.StandardButton.Yes
 
+    @pyqtSlot(bool)
+    def _on_text_enabled_changed(self, checked: bool) -> None:
+        self.text_mapping_editor.set_global_enabled(checked)
+
+    @pyqtSlot(bool)
+    def _on_image_enabled_changed(self, checked: bool) -> None:
+        self.image_mapping_editor.set_global_enabled(checked)
+
+    @pyqtSlot(bool)
+    def _on_audio_enabled_changed(self, checked: bool) -> None:
+        self.audio_mapping_editor.set_global_enabled(checked)
+
+    @pyqtSlot(int)
+    def _on_text_provider_changed(self, index: int) -> None:
+        self._on_provider_combo_changed("text", index)
+
+    @pyqtSlot(int)
+    def _on_image_provider_changed(self, index: int) -> None:
+        self._on_provider_combo_changed("image", index)
+
+    @pyqtSlot(int)
+    def _on_audio_provider_changed(self, index: int) -> None:
+        self._on_provider_combo_changed("audio", index)
+
     def _on_provider_combo_changed(self, kind: str, index: int) -> None:
-        if kind == "text":
-            combo = self.text_section.provider_combo
-            update_button = self._update_text_reset_button
-            key_map = self._text_api_keys
-            target_input = self.api_key_input
-            defaults_fn = self._apply_text_provider_defaults
-        elif kind == "image":
-            combo = self.image_section.provider_combo
-            update_button = self._update_image_reset_button
-            key_map = self._image_api_keys
-            target_input = self.image_api_key_input
-            defaults_fn = self._apply_image_provider_defaults
-        else:
-            combo = self.audio_section.provider_combo
-            update_button = self._update_audio_reset_button
-            key_map = self._audio_api_keys
-            target_input = self.audio_api_key_input
-            defaults_fn = self._apply_audio_provider_defaults
+        section, update_button, key_map, target_input, defaults_fn = (
+            self._provider_dispatch[kind]
+        )
+        combo = section.provider_combo
         if combo is None:
             return
         previous_index = self._provider_indices.get(kind, -1)
@@ -515,7 +887,7 @@ class UserBaseDialog(QWidget):
         if previous_index == index:
             update_button()
             return
-        if self._dirty and not self._confirm_discard_changes("切换提供者"):
+        if not self._confirm_discard_changes("切换提供者"):
             self._loading = True
             combo.setCurrentIndex(previous_index)
             self._loading = False
@@ -535,20 +907,22 @@ class UserBaseDialog(QWidget):
     # Data loading -----------------------------------------------------
 
     def _load_from_settings(self) -> None:
-        retry_limit = int(
-            self.app_settings.value(
-                SettingsNames.RETRY_LIMIT_SETTING_NAME, defaultValue=50
-            )
-            or 50
-        )
+        # One childKeys() call lets unset settings fall back to their defaults
+        # without a value() lookup each.
+        self._present_keys = frozenset(self.app_settings.childKeys())
+        self._loaded_snapshot.clear()
+        retry_limit = self._int_setting(SettingsNames.RETRY_LIMIT_SETTING_NAME, 50)
         retry_delay = float(
-            self.app_settings.value(
-                SettingsNames.RETRY_DELAY_SETTING_NAME, defaultValue=5.0
-            )
+            self._read_setting(SettingsNames.RETRY_DELAY_SETTING_NAME, default=5.0)
             or 5.0
         )
         self.retry_section.set_values(retry_limit, retry_delay)
 
+        for attr, setting_name, default, setter in self._LOAD_TABLE:
+            getattr(getattr(self, attr), setter)(
+                self._str_setting(setting_name, default)
+            )
+
         enable_text = self._get_bool_setting(
             SettingsNames.ENABLE_TEXT_GENERATION_SETTING_NAME, True
         )
@@ -557,34 +931,11 @@ class UserBaseDialog(QWidget):
         text_rows = self._load_text_rows()
         self.text_mapping_editor.set_entries(text_rows)
 
-        self.api_key_input.setText(
-            self.app_settings.value(SettingsNames.API_KEY_SETTING_NAME, type=str) or ""
-        )
-        self.endpoint_input.setText(
-            self.app_settings.value(SettingsNames.ENDPOINT_SETTING_NAME, type=str) or ""
+        text_provider = self._str_setting(
+            SettingsNames.TEXT_PROVIDER_SETTING_NAME, "custom"
         )
-        self.model_input.setText(
-            self.app_settings.value(SettingsNames.MODEL_SETTING_NAME, type=str) or ""
-        )
-        self.system_prompt_input.setPlainText(
-            self.app_settings.value(SettingsNames.SYSTEM_PROMPT_SETTING_NAME, type=str)
-            or ""
-        )
-        self.user_prompt_input.setPlainText(
-            self.app_settings.value(SettingsNames.USER_PROMPT_SETTING_NAME, type=str)
-            or ""
-        )
-        text_provider = (
-            self.app_settings.value(SettingsNames.TEXT_PROVIDER_SETTING_NAME, type=str)
-            or "custom"
-        )
-        text_custom_value = (
-            self.app_settings.value(
-                SettingsNames.TEXT_PROVIDER_CUSTOM_VALUE_SETTING_NAME,
-                defaultValue="",
-                type=str,
-            )
-            or ""
+        text_custom_value = self._str_setting(
+            SettingsNames.TEXT_PROVIDER_CUSTOM_VALUE_SETTING_NAME
         )
         self.text_section.set_provider(text_provider, text_custom_value)
 
@@ -594,27 +945,14 @@ class UserBaseDialog(QWidget):
         self.image_section.set_enabled(enable_image)
         self.image_mapping_editor.set_global_enabled(enable_image)
         image_rows = self._decode_mapping_rows(
-            self.app_settings.value(
-                SettingsNames.IMAGE_MAPPING_SETTING_NAME, type="QStringList"
+            self._read_setting(
+                SettingsNames.IMAGE_MAPPING_SETTING_NAME, type_="QStringList"
             )
             or []
         )
         self.image_mapping_editor.set_entries(image_rows)
-        self.image_api_key_input.setText(
-            self.app_settings.value(SettingsNames.IMAGE_API_KEY_SETTING_NAME, type=str)
-            or ""
-        )
-        self.image_endpoint_input.setText(
-            self.app_settings.value(SettingsNames.IMAGE_ENDPOINT_SETTING_NAME, type=str)
-            or ""
-        )
-        self.image_model_input.setText(
-            self.app_settings.value(SettingsNames.IMAGE_MODEL_SETTING_NAME, type=str)
-            or ""
-        )
-        image_provider = (
-            self.app_settings.value(SettingsNames.IMAGE_PROVIDER_SETTING_NAME, type=str)
-            or "custom"
+        image_provider = self._str_setting(
+            SettingsNames.IMAGE_PROVIDER_SETTING_NAME, "custom"
         )
         self.image_section.set_provider(image_provider)
 
@@ -624,35 +962,14 @@ class UserBaseDialog(QWidget):
         self.audio_section.set_enabled(enable_audio)
         self.audio_mapping_editor.set_global_enabled(enable_audio)
         audio_rows = self._decode_mapping_rows(
-            self.app_settings.value(
-                SettingsNames.AUDIO_MAPPING_SETTING_NAME, type="QStringList"
+            self._read_setting(
+                SettingsNames.AUDIO_MAPPING_SETTING_NAME, type_="QStringList"
             )
             or []
         )
         self.audio_mapping_editor.set_entries(audio_rows)
-        self.audio_api_key_input.setText(
-            self.app_settings.value(SettingsNames.AUDIO_API_KEY_SETTING_NAME, type=str)
-            or ""
-        )
-        self.audio_endpoint_input.setText(
-            self.app_settings.value(SettingsNames.AUDIO_ENDPOINT_SETTING_NAME, type=str)
-            or ""
-        )
-        self.audio_model_input.setText(
-            self.app_settings.value(SettingsNames.AUDIO_MODEL_SETTING_NAME, type=str)
-            or ""
-        )
-        self.audio_voice_input.setText(
-            self.app_settings.value(SettingsNames.AUDIO_VOICE_SETTING_NAME, type=str)
-            or ""
-        )
-        self.audio_format_input.setText(
-            self.app_settings.value(SettingsNames.AUDIO_FORMAT_SETTING_NAME, type=str)
-            or "wav"
-        )
-        audio_provider = (
-            self.app_settings.value(SettingsNames.AUDIO_PROVIDER_SETTING_NAME, type=str)
-            or "custom"
+        audio_provider = self._str_setting(
+            SettingsNames.AUDIO_PROVIDER_SETTING_NAME, "custom"
         )
         self.audio_section.set_provider(audio_provider)
 
@@ -660,9 +977,6 @@ class UserBaseDialog(QWidget):
             SettingsNames.AUTO_GENERATE_ON_ADD_SETTING_NAME, False
         )
         self.auto_generate_checkbox.setChecked(auto_generate)
-        self.auto_queue_display_field_input.setText(
-            self.app_settings.value(SettingsNames.AUTO_QUEUE_DISPLAY_FIELD, type=str) or ""
-        )
         self.auto_queue_silent_checkbox.setChecked(
             self._get_bool_setting(SettingsNames.AUTO_QUEUE_SILENT_SETTING_NAME, False)
         )
@@ -670,69 +984,24 @@ class UserBaseDialog(QWidget):
         self.schedule_enable_checkbox.setChecked(
             self._get_bool_setting(SettingsNames.SCHEDULE_ENABLED_SETTING_NAME, False)
         )
-        self.schedule_query_input.setText(
-            self.app_settings.value(SettingsNames.SCHEDULE_QUERY_SETTING_NAME, type=str)
-            or ""
-        )
         self.schedule_interval_input.setValue(
-            int(
-                self.app_settings.value(
-                    SettingsNames.SCHEDULE_INTERVAL_MIN_SETTING_NAME, defaultValue=10
-                )
-                or 10
-            )
+            self._int_setting(SettingsNames.SCHEDULE_INTERVAL_MIN_SETTING_NAME, 10)
         )
         self.schedule_batch_size_input.setValue(
-            int(
-                self.app_settings.value(
-                    SettingsNames.SCHEDULE_BATCH_SIZE_SETTING_NAME, defaultValue=5
-                )
-                or 5
-            )
+            self._int_setting(SettingsNames.SCHEDULE_BATCH_SIZE_SETTING_NAME, 5)
         )
         self.schedule_daily_limit_input.setValue(
-            int(
-                self.app_settings.value(
-                    SettingsNames.SCHEDULE_DAILY_LIMIT_SETTING_NAME, defaultValue=30
-                )
-                or 30
-            )
+            self._int_setting(SettingsNames.SCHEDULE_DAILY_LIMIT_SETTING_NAME, 30)
         )
         self.schedule_notice_seconds_input.setValue(
-            int(
-                self.app_settings.value(
-                    SettingsNames.SCHEDULE_NOTICE_SECONDS_SETTING_NAME, defaultValue=30
-                )
-                or 30
-            )
+            self._int_setting(SettingsNames.SCHEDULE_NOTICE_SECONDS_SETTING_NAME, 30)
         )
 
         self.oaad_enable_checkbox.setChecked(
             self._get_bool_setting(SettingsNames.OAAD_ENABLED_SETTING_NAME, True)
         )
-        self.oaad_source_input.setText(
-            self.app_settings.value(
-                SettingsNames.OAAD_SOURCE_FIELD_SETTING_NAME,
-                defaultValue="_word",
-                type=str,
-            )
-            or "_word"
-        )
-        self.oaad_target_input.setText(
-            self.app_settings.value(
-                SettingsNames.OAAD_TARGET_FIELD_SETTING_NAME,
-                defaultValue="_oaad",
-                type=str,
-            )
-            or "_oaad"
-        )
         self._select_oaad_accent(
-            self.app_settings.value(
-                SettingsNames.OAAD_ACCENT_SETTING_NAME,
-                defaultValue="us",
-                type=str,
-            )
-            or "us"
+            self._str_setting(SettingsNames.OAAD_ACCENT_SETTING_NAME, "us")
         )
         self.oaad_overwrite_checkbox.setChecked(
             self._get_bool_setting(SettingsNames.OAAD_OVERWRITE_SETTING_NAME, False)
@@ -742,29 +1011,8 @@ class UserBaseDialog(QWidget):
             SettingsNames.YOUGLISH_ENABLED_SETTING_NAME, True
         )
         self.youglish_enable_checkbox.setChecked(youglish_enabled)
-        self.youglish_source_input.setText(
-            self.app_settings.value(
-                SettingsNames.YOUGLISH_SOURCE_FIELD_SETTING_NAME,
-                defaultValue="_word",
-                type=str,
-            )
-            or "_word"
-        )
-        self.youglish_target_input.setText(
-            self.app_settings.value(
-                SettingsNames.YOUGLISH_TARGET_FIELD_SETTING_NAME,
-                defaultValue="_youglish",
-                type=str,
-            )
-            or "_youglish"
-        )
         self._select_youglish_accent(
-            self.app_settings.value(
-                SettingsNames.YOUGLISH_ACCENT_SETTING_NAME,
-                defaultValue="us",
-                type=str,
-            )
-            or "us"
+            self._str_setting(SettingsNames.YOUGLISH_ACCENT_SETTING_NAME, "us")
         )
         self.youglish_overwrite_checkbox.setChecked(
             self._get_bool_setting(SettingsNames.YOUGLISH_OVERWRITE_SETTING_NAME, False)
@@ -801,49 +1049,53 @@ class UserBaseDialog(QWidget):
     # Acceptance -------------------------------------------------------
 
     def accept(self) -> bool:
-        if not self._validate():
+        # Read every input once and share the values between both passes.
+        values = self._capture_state()
+        if not self._validate(values):
             return False
-        self._persist()
+        self._persist(values)
         self._reset_dirty_state()
         return True
 
     # Internal helpers -------------------------------------------------
 
-    def _validate(self) -> bool:
-        text_enabled = self.text_section.is_enabled()
-        image_enabled = self.image_section.is_enabled()
-        audio_enabled = self.audio_section.is_enabled()
+    def _validate(self, values: Dict[str, Any]) -> bool:
+        text_enabled = values["text_enabled"]
+        image_enabled = values["image_enabled"]
+        audio_enabled = values["audio_enabled"]
 
-        if text_enabled and not self.api_key_input.text().strip():
+        if text_enabled and not values["text_api_key"]:
             self._show_error("Enter the API key before running the plugin.")
             return False
-        if text_enabled and not self.user_prompt_input.toPlainText().strip():
+        if text_enabled and not values["user_prompt"]:
             self._show_error("Enter a user prompt before running the plugin.")
             return False
 
-        text_rows = self.text_mapping_editor.get_entries()
-        has_text_mapping = any(key and field and enabled for key, field, enabled in text_rows)
-        if text_enabled and not has_text_mapping:
+        if text_enabled and not self.text_mapping_editor.has_enabled_complete_row():
             self._show_error("Configure at least one text mapping before running the plugin.")
             return False
 
-        image_rows = self.image_mapping_editor.get_entries()
-        has_image_mapping = any(enabled and prompt and target for prompt, target, enabled in image_rows)
-        if image_enabled and has_image_mapping and not self.image_api_key_input.text().strip():
+        if (
+            image_enabled
+            and self.image_mapping_editor.has_enabled_complete_row()
+            and not values["image_api_key"]
+        ):
             self._show_error("Enter the image API key before generating images.")
             return False
 
-        audio_rows = self.audio_mapping_editor.get_entries()
-        has_audio_mapping = any(enabled and source and dest for source, dest, enabled in audio_rows)
-        if audio_enabled and has_audio_mapping and not self.audio_api_key_input.text().strip():
+        if (
+            audio_enabled
+            and self.audio_mapping_editor.has_enabled_complete_row()
+            and not values["audio_api_key"]
+        ):
             self._show_error("Enter the speech API key before generating audio.")
             return False
-        if self.oaad_enable_checkbox.isChecked():
-            if not self.oaad_source_input.text().strip() or not self.oaad_target_input.text().strip():
+        if values["oaad_enabled"]:
+            if not values["oaad_source"] or not values["oaad_target"]:
                 self._show_error("Enter both source and target fields for OAAD links.")
                 return False
-        if self.youglish_enable_checkbox.isChecked():
-            if not self.youglish_source_input.text().strip() or not self.youglish_target_input.text().strip():
+        if values["youglish_enabled"]:
+            if not values["youglish_source"] or not values["youglish_target"]:
                 self._show_error("Enter both source and target fields for YouGlish links.")
                 return False
 
@@ -856,202 +1108,72 @@ class UserBaseDialog(QWidget):
             return False
         return True
 
-    def _persist(self) -> None:
-        retry_limit, retry_delay = self.retry_section.values()
-        self.app_settings.setValue(SettingsNames.RETRY_LIMIT_SETTING_NAME, retry_limit)
-        self.app_settings.setValue(SettingsNames.RETRY_DELAY_SETTING_NAME, retry_delay)
-
-        text_provider = self.text_section.provider()
-        image_provider = self.image_section.provider()
-        audio_provider = self.audio_section.provider()
-
-        current_text_key = self.api_key_input.text().strip()
-        self._text_api_keys[text_provider[0]] = current_text_key
-        self.app_settings.setValue(
-            SettingsNames.API_KEY_SETTING_NAME, current_text_key
-        )
-        self.app_settings.setValue(
-            SettingsNames.ENDPOINT_SETTING_NAME, self.endpoint_input.text().strip()
-        )
-        self.app_settings.setValue(
-            SettingsNames.MODEL_SETTING_NAME, self.model_input.text().strip()
-        )
-        self.app_settings.setValue(
-            SettingsNames.SYSTEM_PROMPT_SETTING_NAME,
-            self.system_prompt_input.toPlainText().strip(),
-        )
-        self.app_settings.setValue(
-            SettingsNames.USER_PROMPT_SETTING_NAME,
-            self.user_prompt_input.toPlainText().strip(),
-        )
-
-        text_rows = self.text_mapping_editor.get_entries()
-        text_entries = [
-            {"key": key, "field": field, "enabled": enabled}
-            for key, field, enabled in text_rows
-            if key or field
-        ]
-        response_keys = [key for key, field, enabled in text_rows if enabled and key and field]
-        destination_fields = [field for key, field, enabled in text_rows if enabled and key and field]
-        self.app_settings.setValue(
-            SettingsNames.TEXT_MAPPING_ENTRIES_SETTING_NAME,
-            json.dumps(text_entries, ensure_ascii=False),
-        )
-        self.app_settings.setValue(
-            SettingsNames.RESPONSE_KEYS_SETTING_NAME,
-            response_keys,
-        )
-        self.app_settings.setValue(
-            SettingsNames.DESTINATION_FIELD_SETTING_NAME,
-            destination_fields,
-        )
-        self.app_settings.setValue(
-            SettingsNames.ENABLE_TEXT_GENERATION_SETTING_NAME,
-            self.text_section.is_enabled(),
-        )
-
-        self.app_settings.setValue(
-            SettingsNames.IMAGE_MAPPING_SETTING_NAME,
-            self._encode_mapping_entries(self.image_mapping_editor.get_entries()),
-        )
-        current_image_key = self.image_api_key_input.text().strip()
-        self._image_api_keys[image_provider[0]] = current_image_key
-        self.app_settings.setValue(
-            SettingsNames.IMAGE_API_KEY_SETTING_NAME,
-            current_image_key,
-        )
-        self.app_settings.setValue(
-            SettingsNames.IMAGE_ENDPOINT_SETTING_NAME,
-            self.image_endpoint_input.text().strip(),
-        )
-        self.app_settings.setValue(
-            SettingsNames.IMAGE_MODEL_SETTING_NAME,
-            self.image_model_input.text().strip(),
-        )
-        self.app_settings.setValue(
-            SettingsNames.ENABLE_IMAGE_GENERATION_SETTING_NAME,
-            self.image_section.is_enabled(),
-        )
+    def _persist(self, values: Dict[str, Any]) -> None:
+        with _SettingsBatch(self.app_settings, self._loaded_snapshot) as writer:
+            retry_limit, retry_delay = self.retry_section.values()
+            writer[SettingsNames.RETRY_LIMIT_SETTING_NAME] = retry_limit
+            writer[SettingsNames.RETRY_DELAY_SETTING_NAME] = retry_delay
+
+            for name, key, fallback in self._SAVE_TABLE:
+                value = values[key]
+                writer[name] = value if fallback is None else value or fallback
+
+            text_provider = self.text_section.provider()
+            image_provider = self.image_section.provider()
+            audio_provider = self.audio_section.provider()
+
+            current_text_key = values["text_api_key"]
+            self._text_api_keys[text_provider[0]] = current_text_key
+            writer[SettingsNames.API_KEY_SETTING_NAME] = current_text_key
+            current_image_key = values["image_api_key"]
+            self._image_api_keys[image_provider[0]] = current_image_key
+            writer[SettingsNames.IMAGE_API_KEY_SETTING_NAME] = current_image_key
+            current_audio_key = values["audio_api_key"]
+            self._audio_api_keys[audio_provider[0]] = current_audio_key
+            writer[SettingsNames.AUDIO_API_KEY_SETTING_NAME] = current_audio_key
+
+            text_rows = self.text_mapping_editor.get_entries()
+            text_entries: list[dict[str, Any]] = []
+            response_keys: list[str] = []
+            destination_fields: list[str] = []
+            for key, field, enabled in text_rows:
+                if not key and not field:
+                    continue
+                text_entries.append({"key": key, "field": field, "enabled": enabled})
+                if enabled and key and field:
+                    response_keys.append(key)
+                    destination_fields.append(field)
+            writer[SettingsNames.TEXT_MAPPING_ENTRIES_SETTING_NAME] = json.dumps(
+                text_entries, ensure_ascii=False
+            )
+            writer[SettingsNames.RESPONSE_KEYS_SETTING_NAME] = response_keys
+            writer[SettingsNames.DESTINATION_FIELD_SETTING_NAME] = destination_fields
 
-        self.app_settings.setValue(
-            SettingsNames.AUDIO_MAPPING_SETTING_NAME,
-            self._encode_mapping_entries(self.audio_mapping_editor.get_entries()),
-        )
-        current_audio_key = self.audio_api_key_input.text().strip()
-        self._audio_api_keys[audio_provider[0]] = current_audio_key
-        self.app_settings.setValue(
-            SettingsNames.AUDIO_API_KEY_SETTING_NAME,
-            current_audio_key,
-        )
-        self.app_settings.setValue(
-            SettingsNames.AUDIO_ENDPOINT_SETTING_NAME,
-            self.audio_endpoint_input.text().strip(),
-        )
-        self.app_settings.setValue(
-            SettingsNames.AUDIO_MODEL_SETTING_NAME,
-            self.audio_model_input.text().strip(),
-        )
-        self.app_settings.setValue(
-            SettingsNames.AUDIO_VOICE_SETTING_NAME,
-            self.audio_voice_input.text().strip(),
-        )
-        self.app_settings.setValue(
-            SettingsNames.AUDIO_FORMAT_SETTING_NAME,
-            self.audio_format_input.text().strip() or "wav",
-        )
-        self.app_settings.setValue(
-            SettingsNames.ENABLE_AUDIO_GENERATION_SETTING_NAME,
-            self.audio_section.is_enabled(),
-        )
-        self.app_settings.setValue(
-            SettingsNames.AUTO_GENERATE_ON_ADD_SETTING_NAME,
-            self.auto_generate_checkbox.isChecked(),
-        )
-        self.app_settings.setValue(
-            SettingsNames.AUTO_QUEUE_DISPLAY_FIELD,
-            self.auto_queue_display_field_input.text().strip(),
-        )
-        self.app_settings.setValue(
-            SettingsNames.AUTO_QUEUE_SILENT_SETTING_NAME,
-            self.auto_queue_silent_checkbox.isChecked(),
-        )
-        self.app_settings.setValue(
-            SettingsNames.SCHEDULE_ENABLED_SETTING_NAME,
-            self.schedule_enable_checkbox.isChecked(),
-        )
-        self.app_settings.setValue(
-            SettingsNames.SCHEDULE_QUERY_SETTING_NAME,
-            self.schedule_query_input.text().strip(),
-        )
-        self.app_settings.setValue(
-            SettingsNames.SCHEDULE_INTERVAL_MIN_SETTING_NAME,
-            self.schedule_interval_input.value(),
-        )
-        self.app_settings.setValue(
-            SettingsNames.SCHEDULE_BATCH_SIZE_SETTING_NAME,
-            self.schedule_batch_size_input.value(),
-        )
-        self.app_settings.setValue(
-            SettingsNames.SCHEDULE_DAILY_LIMIT_SETTING_NAME,
-            self.schedule_daily_limit_input.value(),
-        )
-        self.app_settings.setValue(
-            SettingsNames.SCHEDULE_NOTICE_SECONDS_SETTING_NAME,
-            self.schedule_notice_seconds_input.value(),
-        )
-        self.app_settings.setValue(
-            SettingsNames.OAAD_ENABLED_SETTING_NAME,
-            self.oaad_enable_checkbox.isChecked(),
-        )
-        self.app_settings.setValue(
-            SettingsNames.OAAD_SOURCE_FIELD_SETTING_NAME,
-            self.oaad_source_input.text().strip() or "_word",
-        )
-        self.app_settings.setValue(
-            SettingsNames.OAAD_TARGET_FIELD_SETTING_NAME,
-            self.oaad_target_input.text().strip() or "_oaad",
-        )
-        self.app_settings.setValue(
-            SettingsNames.OAAD_ACCENT_SETTING_NAME,
-            str(self.oaad_accent_combo.currentData() or "us"),
-        )
-        self.app_settings.setValue(
-            SettingsNames.OAAD_OVERWRITE_SETTING_NAME,
-            self.oaad_overwrite_checkbox.isChecked(),
-        )
-        self.app_settings.setValue(
-            SettingsNames.YOUGLISH_ENABLED_SETTING_NAME,
-            self.youglish_enable_checkbox.isChecked(),
-        )
-        self.app_settings.setValue(
-            SettingsNames.YOUGLISH_SOURCE_FIELD_SETTING_NAME,
-            self.youglish_source_input.text().strip() or "_word",
-        )
-        self.app_settings.setValue(
-            SettingsNames.YOUGLISH_TARGET_FIELD_SETTING_NAME,
-            self.youglish_target_input.text().strip() or "_youglish",
-        )
-        self.app_settings.setValue(
-            SettingsNames.YOUGLISH_ACCENT_SETTING_NAME,
-            str(self.youglish_accent_combo.currentData() or "us"),
-        )
-        self.app_settings.setValue(
-            SettingsNames.YOUGLISH_OVERWRITE_SETTING_NAME,
-            self.youglish_overwrite_checkbox.isChecked(),
-        )
+            writer[SettingsNames.IMAGE_MAPPING_SETTING_NAME] = (
+                self._encode_mapping_entries(self.image_mapping_editor.get_entries())
+            )
+            writer[SettingsNames.AUDIO_MAPPING_SETTING_NAME] = (
+                self._encode_mapping_entries(self.audio_mapping_editor.get_entries())
+            )
 
     def _load_text_rows(self) -> list[tuple[str, str, bool]]:
-        raw_entries = self.app_settings.value(
+        raw_entries = self._read_setting(
             SettingsNames.TEXT_MAPPING_ENTRIES_SETTING_NAME,
-            type=str,
+            type_=str,
         )
         if not raw_entries:
-            keys = self.app_settings.value(
-                SettingsNames.RESPONSE_KEYS_SETTING_NAME, type="QStringList"
-            ) or []
-            fields = self.app_settings.value(
-                SettingsNames.DESTINATION_FIELD_SETTING_NAME, type="QStringList"
-            ) or []
+            keys = (
+                self._read_setting(
+                    SettingsNames.RESPONSE_KEYS_SETTING_NAME, type_="QStringList"
+                )
+                or []
+            )
+            fields = (
+                self._read_setting(
+                    SettingsNames.DESTINATION_FIELD_SETTING_NAME, type_="QStringList"
+                )
+                or []
+            )
             if keys and fields and len(keys) == len(fields):
                 return [(str(k), str(f), True) for k, f in zip(keys, fields)]
             return []
@@ -1069,83 +1191,88 @@ class UserBaseDialog(QWidget):
             entries.append((key, field, enabled))
         return entries
 
+    @pyqtSlot()
+    def _on_text_defaults_clicked(self) -> None:
+        self._apply_text_provider_defaults(force=True)
+
+    @pyqtSlot()
+    def _on_image_defaults_clicked(self) -> None:
+        self._apply_image_provider_defaults(force=True)
+
+    @pyqtSlot()
+    def _on_audio_defaults_clicked(self) -> None:
+        self._apply_audio_provider_defaults(force=True)
+
     def _apply_text_provider_defaults(self, *, force: bool = False) -> None:
-        combo = self.text_section.provider_combo
-        if combo is None:
-            return
-        provider = combo.currentData()
-        if provider is None:
-            return
-        apply_provider_defaults(
-            str(provider),
+        self._apply_section_defaults(
+            self.text_section,
             TEXT_PROVIDER_DEFAULTS,
+            self.text_defaults_button,
+            force=force,
             endpoint_input=self.endpoint_input,
             model_input=self.model_input,
-            force=force,
         )
-        self._update_text_reset_button()
 
     def _apply_image_provider_defaults(self, *, force: bool = False) -> None:
-        combo = self.image_section.provider_combo
-        if combo is None:
-            return
-        provider = combo.currentData()
-        if provider is None:
-            return
-        apply_provider_defaults(
-            str(provider),
+        self._apply_section_defaults(
+            self.image_section,
             IMAGE_PROVIDER_DEFAULTS,
+            self.image_defaults_button,
+            force=force,
             endpoint_input=self.image_endpoint_input,
             model_input=self.image_model_input,
-            force=force,
         )
-        self._update_image_reset_button()
 
     def _apply_audio_provider_defaults(self, *, force: bool = False) -> None:
-        combo = self.audio_section.provider_combo
-        if combo is None:
-            return
-        provider = combo.currentData()
-        if provider is None:
-            return
-        apply_provider_defaults(
-            str(provider),
+        self._apply_section_defaults(
+            self.audio_section,
             AUDIO_PROVIDER_DEFAULTS,
+            self.audio_defaults_button,
+            force=force,
             endpoint_input=self.audio_endpoint_input,
             model_input=self.audio_model_input,
             voice_input=self.audio_voice_input,
             format_input=self.audio_format_input,
-            force=force,
         )
-        self._update_audio_reset_button()
+
+    def _apply_section_defaults(
+        self,
+        section: GenerationSection,
+        defaults_map: Dict[str, Dict[str, str]],
+        button: QPushButton,
+        *,
+        force: bool,
+        **inputs: QLineEdit,
+    ) -> None:
+        combo = section.provider_combo
+        if combo is None:
+            return
+        provider = combo.currentData()
+        if provider is None:
+            return
+        apply_provider_defaults(str(provider), defaults_map, force=force, **inputs)
+        _refresh_reset_button(section, button, defaults_map)
 
     def _update_text_reset_button(self) -> None:
-        self.text_defaults_button.setEnabled(
-            reset_button_enabled(self.text_section.provider_combo, TEXT_PROVIDER_DEFAULTS)
+        _refresh_reset_button(
+            self.text_section, self.text_defaults_button, TEXT_PROVIDER_DEFAULTS
         )
 
     def _update_image_reset_button(self) -> None:
-        self.image_defaults_button.setEnabled(
-            reset_button_enabled(self.image_section.provider_combo, IMAGE_PROVIDER_DEFAULTS)
+        _refresh_reset_button(
+            self.image_section, self.image_defaults_button, IMAGE_PROVIDER_DEFAULTS
         )
 
     def _update_audio_reset_button(self) -> None:
-        self.audio_defaults_button.setEnabled(
-            reset_button_enabled(self.audio_section.provider_combo, AUDIO_PROVIDER_DEFAULTS)
+        _refresh_reset_button(
+            self.audio_section, self.audio_defaults_button, AUDIO_PROVIDER_DEFAULTS
         )
 
     def _select_youglish_accent(self, accent: str) -> None:
-        normalized = (accent or "us").lower()
-        index = self.youglish_accent_combo.findData(normalized)
-        if index == -1:
-            normalized = "us"
-            index = self.youglish_accent_combo.findData(normalized)
-        blocked = self.youglish_accent_combo.blockSignals(True)
-        if index != -1:
-            self.youglish_accent_combo.setCurrentIndex(index)
-        self.youglish_accent_combo.blockSignals(blocked)
-
-    def _update_youglish_enabled_state(self) -> None:
+        _select_accent(self.youglish_accent_combo, self._youglish_accent_index, accent)
+
+    @pyqtSlot(bool)
+    def _update_youglish_enabled_state(self, _checked: bool = False) -> None:
         enabled = self.youglish_enable_checkbox.isChecked()
         for widget in (
             self.youglish_source_input,
@@ -1153,20 +1280,13 @@ class UserBaseDialog(QWidget):
             self.youglish_accent_combo,
             self.youglish_overwrite_checkbox,
         ):
-            widget.setEnabled(enabled)
+            _set_enabled(widget, enabled)
 
     def _select_oaad_accent(self, accent: str) -> None:
-        normalized = (accent or "us").lower()
-        index = self.oaad_accent_combo.findData(normalized)
-        if index == -1:
-            normalized = "us"
-            index = self.oaad_accent_combo.findData(normalized)
-        blocked = self.oaad_accent_combo.blockSignals(True)
-        if index != -1:
-            self.oaad_accent_combo.setCurrentIndex(index)
-        self.oaad_accent_combo.blockSignals(blocked)
-
-    def _update_oaad_enabled_state(self) -> None:
+        _select_accent(self.oaad_accent_combo, self._oaad_accent_index, accent)
+
+    @pyqtSlot(bool)
+    def _update_oaad_enabled_state(self, _checked: bool = False) -> None:
         enabled = self.oaad_enable_checkbox.isChecked()
         for widget in (
             self.oaad_source_input,
@@ -1174,44 +1294,65 @@ class UserBaseDialog(QWidget):
             self.oaad_accent_combo,
             self.oaad_overwrite_checkbox,
         ):
-            widget.setEnabled(enabled)
+            _set_enabled(widget, enabled)
 
     def _decode_mapping_rows(
         self, entries: Iterable[str]
     ) -> list[tuple[str, str, bool]]:
         decoded: list[tuple[str, str, bool]] = []
         for mapping in entries:
-            if not isinstance(mapping, str) or IMAGE_MAPPING_SEPARATOR not in mapping:
+            if not isinstance(mapping, str):
                 continue
-            base = mapping
-            enabled = True
-            if "::" in mapping:
-                base, flag = mapping.rsplit("::", 1)
-                enabled = flag.strip().lower() not in {"0", "false", "no"}
-            if IMAGE_MAPPING_SEPARATOR not in base:
+            base, has_flag, flag = mapping.rpartition("::")
+            if not has_flag:
+                base = flag
+            left, has_sep, right = base.partition(IMAGE_MAPPING_SEPARATOR)
+            if not has_sep:
                 continue
-            left, right = [part.strip() for part in base.split(IMAGE_MAPPING_SEPARATOR, 1)]
+            left = left.strip()
+            right = right.strip()
             if left or right:
+                enabled = not has_flag or flag.strip().lower() not in FALSE_FLAGS
                 decoded.append((left, right, enabled))
         return decoded
 
     def _encode_mapping_entries(
         self, entries: Iterable[tuple[str, str, bool]]
     ) -> list[str]:
-        encoded: list[str] = []
-        for left, right, enabled in entries:
-            if not left or not right:
-                continue
-            flag = "1" if enabled else "0"
-            encoded.append(f"{left}{IMAGE_MAPPING_SEPARATOR}{right}::{flag}")
-        return encoded
+        return [
+            f"{left}{IMAGE_MAPPING_SEPARATOR}{right}::{'1' if enabled else '0'}"
+            for left, right, enabled in entries
+            if left and right
+        ]
+
+    def _read_setting(self, name: str, default: Any = None, type_: Any = None) -> Any:
+        """Read a stored setting; keys missing from storage skip the lookup."""
+        if self._present_keys is not None and name not in self._present_keys:
+            value = default
+        else:
+            if type_ is None:
+                value = self.app_settings.value(name, defaultValue=default)
+            else:
+                value = self.app_settings.value(name, defaultValue=default, type=type_)
+            # Only values that really came from storage may suppress a write;
+            # a default standing in for a missing key must still be saved.
+            self._loaded_snapshot[name] = value
+        return value
+
+    def _str_setting(self, name: str, default: str = "") -> str:
+        value = self._read_setting(name, default=default, type_=str)
+        return value if value else default
+
+    def _int_setting(self, name: str, default: int) -> int:
+        return int(self._read_setting(name, default=default) or default)
 
     def _get_bool_setting(self, name: str, default: bool) -> bool:
-        value = self.app_settings.value(name, defaultValue=default)
-        if isinstance(value, bool):
+        value = self._read_setting(name, default=default)
+        value_type = type(value)
+        if value_type is bool:
             return value
-        if isinstance(value, str):
-            return value.lower() in {"1", "true", "yes"}
+        if value_type is str:
+            return value.lower() in TRUE_STRINGS
         return bool(value)
 
     def _create_titled_group(self, title: str) -> tuple[QGroupBox, QFormLayout]:
@@ -1222,11 +1363,13 @@ class UserBaseDialog(QWidget):
         layout.setContentsMargins(12, 8, 12, 8)
         layout.setSpacing(8)
 
-        title_label = QLabel(title)
-        title_font = QFont(title_label.font())
-        title_font.setPointSize(title_font.pointSize() + 2)
-        title_font.setBold(True)
-        title_label.setFont(title_font)
+        title_label = _plain_label(title)
+        if self._title_font is None:
+            title_font = QFont(title_label.font())
+            title_font.setPointSize(title_font.pointSize() + 2)
+            title_font.setBold(True)
+            self._title_font = title_font
+        title_label.setFont(self._title_font)
         header = QHBoxLayout()
         header.addWidget(title_label)
         header.addStretch()
@@ -1237,9 +1380,8 @@ class UserBaseDialog(QWidget):
         layout.addLayout(form)
         return group, form
 
-    @staticmethod
-    def _show_error(message: str) -> None:
-        msg_box = QMessageBox()
+    def _show_error(self, message: str) -> None:
+        msg_box = QMessageBox(self)
         msg_box.setIcon(QMessageBox.Icon.Critical)
         msg_box.setWindowTitle("Configuration error")
         msg_box.setText(message)